@@ -24,15 +24,23 @@ class DjangoTests(AiidaTestImplementation):
     """
 
     def clean_db(self):
-        from aiida.backends.djsite.db import models
+        from django.db import connection, transaction
 
-        # I first need to delete the links, because in principle I could not delete input nodes, only outputs.
-        # For simplicity, since I am deleting everything, I delete the links first
-        models.DbLink.objects.all().delete()
+        # The tables are emptied with plain SQL statements, since deleting through a queryset first loads all rows as
+        # model instances to emulate the `on_delete` behavior of the foreign keys. Instead, the tables are emptied in an
+        # order where no row is still referenced by a row of another table once it is deleted.
+        tables = (
+            'db_dbgroup_dbnodes',
+            'db_dbgroup',
+            'db_dblog',
+            'db_dblink',
+            'db_dbcomment',
+            'db_dbnode',
+            'db_dbauthinfo',
+            'db_dbcomputer',
+            'db_dbuser',
+        )
 
-        # Then I delete the nodes, otherwise I cannot delete computers and users
-        models.DbLog.objects.all().delete()
-        models.DbNode.objects.all().delete()  # pylint: disable=no-member
-        models.DbUser.objects.all().delete()  # pylint: disable=no-member
-        models.DbComputer.objects.all().delete()
-        models.DbGroup.objects.all().delete()
+        with transaction.atomic(), connection.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f'DELETE FROM {table};')
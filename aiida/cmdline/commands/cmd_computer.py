@@ -345,7 +345,7 @@ def computer_disable(computer, user):
 @with_dbenv()
 def computer_list(all_entries, raw):
     """List all available computers."""
-    from aiida.orm import Computer, User
+    from aiida.orm import AuthInfo, Computer, User
 
     if not raw:
         echo.echo_report('List of configured computers')
@@ -357,9 +357,12 @@ def computer_list(all_entries, raw):
     if not computers:
         echo.echo_report("No computers configured yet. Use 'verdi computer setup'")
 
+    authinfos = AuthInfo.objects.get_many((computer.pk, user.pk) for computer in computers)
+    enabled = {computer_pk for (computer_pk, _), authinfo in authinfos.items() if authinfo.enabled}
+
     sort = lambda computer: computer.label
-    highlight = lambda comp: comp.is_user_configured(user) and comp.is_user_enabled(user)
-    hide = lambda comp: not (comp.is_user_configured(user) and comp.is_user_enabled(user)) and not all_entries
+    highlight = lambda comp: comp.pk in enabled
+    hide = lambda comp: comp.pk not in enabled and not all_entries
     echo.echo_formatted_list(computers, ['label'], sort=sort, highlight=highlight, hide=hide)
 
 
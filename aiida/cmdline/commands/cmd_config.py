@@ -8,8 +8,6 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """`verdi config` command."""
-import textwrap
-
 import click
 
 from aiida.cmdline.commands.cmd_verdi import verdi
@@ -31,7 +29,7 @@ def verdi_config_list(ctx, prefix, description: bool):
 
     Optionally filtered by a prefix.
     """
-    from tabulate import tabulate
+    import textwrap
 
     from aiida.manage.configuration import Config, Profile
 
@@ -49,20 +47,22 @@ def verdi_config_list(ctx, prefix, description: bool):
             return '\n'.join(str(v) for v in val)
         return val
 
+    # filter by prefix and sort by name before building the rows
+    filtered = sorted(((name, values) for name, values in option_values.items() if name.startswith(prefix)),
+                      key=lambda item: item[0])
+
     if description:
-        table = [[name, source, _join(value), '\n'.join(textwrap.wrap(c.description))]
-                 for name, (c, source, value) in option_values.items()
-                 if name.startswith(prefix)]
+        wrap = textwrap.TextWrapper().wrap
+        table = [[name, source, _join(value), '\n'.join(wrap(c.description))] for name, (c, source, value) in filtered]
         headers = ['name', 'source', 'value', 'description']
     else:
-        table = [[name, source, _join(value)]
-                 for name, (c, source, value) in option_values.items()
-                 if name.startswith(prefix)]
+        table = [[name, source, _join(value)] for name, (_, source, value) in filtered]
         headers = ['name', 'source', 'value']
 
-    # sort by name
-    table = sorted(table, key=lambda x: x[0])
-    echo.echo(tabulate(table, headers=headers))
+    if echo.is_stdout_redirected():
+        echo.echo_tsv([headers] + table)
+    else:
+        echo.echo_table(headers, table)
 
 
 @verdi_config.command('show')
@@ -114,6 +114,7 @@ def verdi_config_set(ctx, option, value, globally, append, remove):
 
     List values are split by whitespace, e.g. "a b" becomes ["a", "b"].
     """
+    from aiida.cmdline.utils.common import resolve_config_scope
     from aiida.manage.configuration import Config, Profile, ConfigValidationError
 
     if append and remove:
@@ -122,12 +123,7 @@ def verdi_config_set(ctx, option, value, globally, append, remove):
     config: Config = ctx.obj.config
     profile: Profile = ctx.obj.profile
 
-    if option.global_only:
-        globally = True
-
-    # Define the string that determines the scope: for specific profile or globally
-    scope = profile.name if (not globally and profile) else None
-    scope_text = f"for '{profile.name}' profile" if (not globally and profile) else 'globally'
+    scope, scope_text = resolve_config_scope(profile, globally, option)
 
     if append or remove:
         try:
@@ -157,17 +153,13 @@ def verdi_config_set(ctx, option, value, globally, append, remove):
 @click.pass_context
 def verdi_config_unset(ctx, option, globally):
     """Unset an AiiDA option."""
+    from aiida.cmdline.utils.common import resolve_config_scope
     from aiida.manage.configuration import Config, Profile
 
     config: Config = ctx.obj.config
     profile: Profile = ctx.obj.profile
 
-    if option.global_only:
-        globally = True
-
-    # Define the string that determines the scope: for specific profile or globally
-    scope = profile.name if (not globally and profile) else None
-    scope_text = f"for '{profile.name}' profile" if (not globally and profile) else 'globally'
+    scope, scope_text = resolve_config_scope(profile, globally, option)
 
     # Unset the specified option
     config.unset_option(option.name, scope=scope)
@@ -180,12 +172,14 @@ def verdi_config_unset(ctx, option, globally):
 def verdi_config_caching(disabled):
     """List caching-enabled process types for the current profile."""
     from aiida.plugins.entry_point import ENTRY_POINT_STRING_SEPARATOR, get_entry_point_names
-    from aiida.manage.caching import get_use_cache
+    from aiida.manage.caching import get_cache_matcher
+
+    use_cache = get_cache_matcher()
 
     for group in ['aiida.calculations', 'aiida.workflows']:
         for entry_point in get_entry_point_names(group):
-            identifier = ENTRY_POINT_STRING_SEPARATOR.join([group, entry_point])
-            if get_use_cache(identifier=identifier):
+            identifier = f'{group}{ENTRY_POINT_STRING_SEPARATOR}{entry_point}'
+            if use_cache(identifier):
                 if not disabled:
                     echo.echo(identifier)
             elif disabled:
@@ -29,9 +29,11 @@ def list_options(func):
     return func
 
 
-def query(datatype, project, past_days, group_pks, all_users):
+def query(datatype, project, past_days, group_pks, all_users, stream=False):
     """
     Perform the query
+
+    :param stream: if True, return a generator over the results instead of a list
     """
     import datetime
 
@@ -63,13 +65,20 @@ def query(datatype, project, past_days, group_pks, all_users):
     qbl.order_by({datatype: {'ctime': 'asc'}})
 
     object_list = qbl.distinct()
+
+    if stream:
+        return object_list.iterall()
+
     return object_list.all()
 
 
 # pylint: disable=unused-argument,too-many-arguments
-def data_list(datatype, columns, elements, elements_only, formula_mode, past_days, groups, all_users):
+def data_list(datatype, columns, elements, elements_only, formula_mode, past_days, groups, all_users, stream=False):
     """
     List stored objects
+
+    :param stream: if True, return a generator over the results instead of a list, such that the entries can be
+        processed one by one without keeping all of them in memory
     """
     columns_dict = {
         'ID': 'id',
@@ -87,4 +96,4 @@ def data_list(datatype, columns, elements, elements_only, formula_mode, past_day
     group_pks = None
     if groups is not None:
         group_pks = [g.pk for g in groups]
-    return query(datatype, project, past_days, group_pks, all_users)
+    return query(datatype, project, past_days, group_pks, all_users, stream=stream)
@@ -22,6 +22,7 @@ from aiida.cmdline.utils import decorators, echo
 LIST_PROJECT_HEADERS = ['Id', 'Label']
 EXPORT_FORMATS = ['cif', 'xsf']
 VISUALIZATION_FORMATS = ['jmol', 'xcrysden', 'mpl_heatmap', 'mpl_pos']
+SHOW_FUNCTIONS = {fmt: getattr(cmd_show, f'_show_{fmt}') for fmt in VISUALIZATION_FORMATS}
 
 
 @verdi_data.group('trajectory')
@@ -35,31 +36,39 @@ def trajectory():
 def trajectory_list(raw, past_days, groups, all_users):
     """List TrajectoryData objects stored in the database."""
     from aiida.orm import TrajectoryData
-    from tabulate import tabulate
 
     elements = None
     elements_only = False
     formulamode = None
     entry_list = data_list(
-        TrajectoryData, LIST_PROJECT_HEADERS, elements, elements_only, formulamode, past_days, groups, all_users
+        TrajectoryData,
+        LIST_PROJECT_HEADERS,
+        elements,
+        elements_only,
+        formulamode,
+        past_days,
+        groups,
+        all_users,
+        stream=True
     )
 
+    n_headers = len(LIST_PROJECT_HEADERS)
     counter = 0
-    struct_list_data = list()
-    if not raw:
-        struct_list_data.append(LIST_PROJECT_HEADERS)
-    for entry in entry_list:
-        for i, value in enumerate(entry):
-            if isinstance(value, list):
-                entry[i] = ','.join(value)
-        for i in range(len(entry), len(LIST_PROJECT_HEADERS)):
-            entry.append(None)
-        counter += 1
-    struct_list_data.extend(entry_list)
-    if raw:
-        echo.echo(tabulate(struct_list_data, tablefmt='plain'))
+
+    def iter_rows():
+        """Yield the entries, with list values joined into a comma-separated string and padded to the headers."""
+        nonlocal counter
+        for entry in entry_list:
+            counter += 1
+            row = [','.join(value) if isinstance(value, list) else value for value in entry]
+            yield row + [None] * (n_headers - len(row))
+
+    if raw and echo.is_stdout_redirected():
+        echo.echo_tsv(iter_rows())
+    elif raw:
+        echo.echo_table([], iter_rows(), tablefmt='plain')
     else:
-        echo.echo(tabulate(struct_list_data, headers='firstrow'))
+        echo.echo_table(LIST_PROJECT_HEADERS, iter_rows())
         echo.echo(f'\nTotal results: {counter}\n')
 
 
@@ -71,8 +80,8 @@ def trajectory_list(raw, past_days, groups, all_users):
 def trajectory_show(data, fmt):
     """Visualize a trajectory."""
     try:
-        show_function = getattr(cmd_show, f'_show_{fmt}')
-    except AttributeError:
+        show_function = SHOW_FUNCTIONS[fmt]
+    except KeyError:
         echo.echo_critical(f'visualization format {fmt} is not supported')
 
     show_function(fmt, data)
@@ -13,9 +13,14 @@ import click
 
 from aiida.common import exceptions
 from aiida.cmdline.commands.cmd_verdi import verdi
-from aiida.cmdline.params import options
+from aiida.cmdline.params import options, types
 from aiida.cmdline.utils import decorators, echo
-from aiida.backends.general.migrations.duplicate_uuids import TABLES_UUID_DEDUPLICATION
+
+
+def valid_uuid_deduplication_tables():
+    """Return the database tables for which duplicate UUIDs can be detected and fixed."""
+    from aiida.backends.general.migrations.duplicate_uuids import TABLES_UUID_DEDUPLICATION
+    return TABLES_UUID_DEDUPLICATION
 
 
 @verdi.group('database')
@@ -80,18 +85,19 @@ def database_migrate(force):
 
     try:
         response = click.prompt(confirm_message)
-        while response != expected_answer:
-            response = click.prompt(confirm_message)
     except click.Abort:
+        response = None
         echo.echo('\n')
+
+    if response != expected_answer:
         echo.echo_critical('Migration aborted, the data has not been affected.')
+
+    try:
+        backend.migrate()
+    except (exceptions.ConfigurationError, exceptions.DatabaseMigrationError) as exception:
+        echo.echo_critical(str(exception))
     else:
-        try:
-            backend.migrate()
-        except (exceptions.ConfigurationError, exceptions.DatabaseMigrationError) as exception:
-            echo.echo_critical(str(exception))
-        else:
-            echo.echo_success('migration completed')
+        echo.echo_success('migration completed')
 
 
 @verdi_database.group('integrity')
@@ -103,7 +109,7 @@ def verdi_database_integrity():
 @click.option(
     '-t',
     '--table',
-    type=click.Choice(TABLES_UUID_DEDUPLICATION),
+    type=types.LazyChoice(valid_uuid_deduplication_tables),
     default='db_dbnode',
     help='The database table to operate on.'
 )
@@ -144,8 +150,6 @@ def detect_duplicate_uuid(table, apply_patch):
 @decorators.with_dbenv()
 def detect_invalid_links():
     """Scan the database for invalid links."""
-    from tabulate import tabulate
-
     from aiida.manage.database.integrity.sql.links import INVALID_LINK_SELECT_STATEMENTS
     from aiida.manage.manager import get_manager
 
@@ -153,14 +157,18 @@ def detect_invalid_links():
 
     backend = get_manager().get_backend()
 
-    for check in INVALID_LINK_SELECT_STATEMENTS:
+    results = backend.execute_prepared_statements(
+        (check.sql, check.parameters) for check in INVALID_LINK_SELECT_STATEMENTS
+    )
+
+    for check, result in zip(INVALID_LINK_SELECT_STATEMENTS, results):
 
-        result = backend.execute_prepared_statement(check.sql, check.parameters)
+        if not result:
+            continue
 
-        if result:
-            integrity_violated = True
-            echo.echo_warning(f'{check.message}:\n')
-            echo.echo(tabulate(result, headers=check.headers))
+        integrity_violated = True
+        echo.echo_warning(f'{check.message}:\n')
+        echo.echo_table(check.headers, result)
 
     if not integrity_violated:
         echo.echo_success('no integrity violations detected')
@@ -172,8 +180,6 @@ def detect_invalid_links():
 @decorators.with_dbenv()
 def detect_invalid_nodes():
     """Scan the database for invalid nodes."""
-    from tabulate import tabulate
-
     from aiida.manage.database.integrity.sql.nodes import INVALID_NODE_SELECT_STATEMENTS
     from aiida.manage.manager import get_manager
 
@@ -181,14 +187,18 @@ def detect_invalid_nodes():
 
     backend = get_manager().get_backend()
 
-    for check in INVALID_NODE_SELECT_STATEMENTS:
+    results = backend.execute_prepared_statements(
+        (check.sql, check.parameters) for check in INVALID_NODE_SELECT_STATEMENTS
+    )
+
+    for check, result in zip(INVALID_NODE_SELECT_STATEMENTS, results):
 
-        result = backend.execute_prepared_statement(check.sql, check.parameters)
+        if not result:
+            continue
 
-        if result:
-            integrity_violated = True
-            echo.echo_warning(f'{check.message}:\n')
-            echo.echo(tabulate(result, headers=check.headers))
+        integrity_violated = True
+        echo.echo_warning(f'{check.message}:\n')
+        echo.echo_table(check.headers, result)
 
     if not integrity_violated:
         echo.echo_success('no integrity violations detected')
@@ -197,45 +207,25 @@ def detect_invalid_nodes():
 
 
 @verdi_database.command('summary')
+@decorators.with_dbenv()
 def database_summary():
     """Summarise the entities in the database."""
     from aiida.cmdline import is_verbose
-    from aiida.orm import QueryBuilder, Node, Group, Computer, Comment, Log, User
-    data = {}
+    from aiida.manage.database.integrity.sql.summary import SELECT_DISTINCT_ENTITY_PROPERTIES, SELECT_ENTITY_COUNTS
+    from aiida.manage.manager import get_manager
 
-    # User
-    query_user = QueryBuilder().append(User, project=['email'])
-    data['Users'] = {'count': query_user.count()}
-    if is_verbose():
-        data['Users']['emails'] = query_user.distinct().all(flat=True)
+    backend = get_manager().get_backend()
 
-    # Computer
-    query_comp = QueryBuilder().append(Computer, project=['label'])
-    data['Computers'] = {'count': query_comp.count()}
-    if is_verbose():
-        data['Computers']['labels'] = query_comp.distinct().all(flat=True)
+    # Retrieve the counts of all entity types with a single query
+    data = {name: {'count': count} for name, count in backend.execute_prepared_statement(SELECT_ENTITY_COUNTS, {})}
 
-    # Node
-    count = QueryBuilder().append(Node).count()
-    data['Nodes'] = {'count': count}
     if is_verbose():
-        node_types = QueryBuilder().append(Node, project=['node_type']).distinct().all(flat=True)
-        data['Nodes']['node_types'] = node_types
-        process_types = QueryBuilder().append(Node, project=['process_type']).distinct().all(flat=True)
-        data['Nodes']['process_types'] = [p for p in process_types if p]
-
-    # Group
-    query_group = QueryBuilder().append(Group, project=['type_string'])
-    data['Groups'] = {'count': query_group.count()}
-    if is_verbose():
-        data['Groups']['type_strings'] = query_group.distinct().all(flat=True)
-
-    # Comment
-    count = QueryBuilder().append(Comment).count()
-    data['Comments'] = {'count': count}
-
-    # Log
-    count = QueryBuilder().append(Log).count()
-    data['Logs'] = {'count': count}
+        result = backend.execute_prepared_statement(SELECT_DISTINCT_ENTITY_PROPERTIES, {})
+        emails, labels, node_types, process_types, type_strings = result[0]
+        data['Users']['emails'] = emails or []
+        data['Computers']['labels'] = labels or []
+        data['Nodes']['node_types'] = node_types or []
+        data['Nodes']['process_types'] = [p for p in process_types or [] if p]
+        data['Groups']['type_strings'] = type_strings or []
 
     echo.echo_dictionary(data, sort_keys=False, fmt='yaml')
@@ -521,3 +521,17 @@ def check_worker_load(active_slots):
             echo.echo_report(f'Using {percent_load * 100:.0f}% of the available daemon worker slots')
     else:
         echo.echo_report('No active daemon workers')
+
+
+def resolve_config_scope(profile, globally, option):
+    """Return the scope in which to set or unset a configuration option and a description of it.
+
+    :param profile: the current profile, can be ``None`` if no profile is configured.
+    :param globally: boolean, if True, the option is applied configuration wide.
+    :param option: the configuration option, which is always applied configuration wide if it is ``global_only``.
+    :return: tuple of the scope, which is the profile name or ``None`` if global, and its description for messages.
+    """
+    if option.global_only or globally or not profile:
+        return None, 'globally'
+
+    return profile.name, f"for '{profile.name}' profile"
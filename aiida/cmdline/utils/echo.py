@@ -253,6 +253,29 @@ def echo_dictionary(dictionary, fmt='json+date', sort_keys=True):
     echo(format_function(dictionary, sort_keys=sort_keys))
 
 
+def echo_tsv(rows):
+    """Echo the given rows as tab-separated values.
+
+    Contrary to ``tabulate``, this does not need to compute the width of each column first, which makes it cheaper for
+    large tables whose output is redirected, for example when piped to ``grep``. Values that are ``None`` are written
+    as empty strings and line breaks within values are replaced by spaces, such that each row remains a single line.
+
+    :param rows: iterable of rows, where each row is an iterable of values.
+    """
+    echo('\n'.join('\t'.join('' if value is None else str(value).replace('\n', ' ') for value in row) for row in rows))
+
+
+def echo_table(headers, rows, tablefmt='simple'):
+    """Echo the given rows as a table rendered with ``tabulate``, which is only imported when called.
+
+    :param headers: sequence of column headers, pass an empty sequence to omit the header row.
+    :param rows: iterable of rows, where each row is an iterable of values. Can be a generator.
+    :param tablefmt: the table format to use when rendering with ``tabulate``.
+    """
+    from tabulate import tabulate
+    echo(tabulate(rows, headers=headers, tablefmt=tablefmt))
+
+
 def is_stdout_redirected():
     """Determines if the standard output is redirected.
 
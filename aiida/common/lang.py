@@ -90,3 +90,27 @@ class classproperty:  # pylint: disable=invalid-name
 
     def __get__(self, instance, owner):
         return self.getter(owner)
+
+
+class cached_property:  # pylint: disable=invalid-name
+    """
+    A class that, when used as a decorator, works as a property whose getter
+    is called only once per instance.
+
+    The value is stored in the instance dictionary under the name of the decorated
+    method, which then takes precedence over this (non-data) descriptor, such that any
+    subsequent access is a plain attribute lookup. This is a backport of
+    :class:`functools.cached_property`, which is only available from Python 3.8.
+    """
+
+    def __init__(self, getter):
+        self.getter = getter
+        self.name = getter.__name__
+        self.__doc__ = getter.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name] = self.getter(instance)
+        return value
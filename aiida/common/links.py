@@ -11,11 +11,15 @@
 
 from collections import namedtuple
 from enum import Enum
+import re
 
 from .lang import isidentifier, type_check
 
 __all__ = ('GraphTraversalRule', 'GraphTraversalRules', 'LinkType', 'validate_link_label')
 
+# Link labels are validated for every link that is added, so the pattern of allowed characters is compiled only once
+LINK_LABEL_CHARACTERS = re.compile(r'[a-zA-Z0-9_]*')
+
 
 class LinkType(Enum):
     """A simple enum of allowed link types."""
@@ -104,20 +108,16 @@ def validate_link_label(link_label):
     :raises TypeError: if the link label is not a string type
     :raises ValueError: if the link label is invalid
     """
-    import re
-
     message = f'invalid link label `{link_label}`: should be string type but is instead: {type(link_label)}'
     type_check(link_label, str, message)
 
-    allowed_character_set = '[a-zA-Z0-9_]'
-
     if link_label.endswith('_'):
         raise ValueError('cannot end with an underscore')
 
     if link_label.startswith('_'):
         raise ValueError('cannot start with an underscore')
 
-    if re.sub(allowed_character_set, '', link_label):
+    if LINK_LABEL_CHARACTERS.fullmatch(link_label) is None:
         raise ValueError('only alphanumeric and underscores are allowed')
 
     if not isidentifier(link_label):
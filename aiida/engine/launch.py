@@ -15,7 +15,7 @@ from aiida.manage import manager
 from aiida.orm import ProcessNode
 from .processes.functions import FunctionProcess
 from .processes.process import Process, ProcessBuilder
-from .utils import is_process_scoped, instantiate_process
+from .utils import instantiate_process
 
 __all__ = ('run', 'run_get_pk', 'run_get_node', 'submit')
 
@@ -91,7 +91,8 @@ def submit(process: TYPE_SUBMIT_PROCESS, **inputs: Any) -> ProcessNode:
     """
     # Submitting from within another process requires `self.submit` unless it is a work function, in which case the
     # current process in the scope should be an instance of `FunctionProcess`
-    if is_process_scoped() and not isinstance(Process.current(), FunctionProcess):
+    current = Process.current()
+    if current is not None and not isinstance(current, FunctionProcess):
         raise InvalidOperation('Cannot use top-level `submit` from within another process, use `self.submit` instead')
 
     runner = manager.get_manager().get_runner()
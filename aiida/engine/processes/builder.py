@@ -9,8 +9,10 @@
 ###########################################################################
 """Convenience classes to help building the input dictionaries for Processes."""
 import collections
-from typing import Any, Type, TYPE_CHECKING
+import functools
+from typing import Any, Dict, Tuple, Type, TYPE_CHECKING
 from uuid import uuid4
+import weakref
 
 from aiida.orm import Node
 from aiida.engine.processes.ports import PortNamespace
@@ -20,6 +22,72 @@ if TYPE_CHECKING:
 
 __all__ = ('ProcessBuilder', 'ProcessBuilderNamespace')
 
+# Mapping of the id of a port namespace onto a weak reference to it and the name and description of each of its ports
+_NAMESPACE_FIELDS: Dict[int, Tuple[weakref.ref, Tuple[Tuple[str, str], ...]]] = {}
+
+
+def _get_fields(port_namespace: PortNamespace) -> Tuple[Tuple[str, str], ...]:
+    """Return the name and description of each port of the given port namespace.
+
+    .. note:: the result is cached for each port namespace, since the description of a nested port namespace includes
+        the descriptions of all its ports, so computing them for every new builder scales with the size of the entire
+        namespace. The cache is refreshed when ports are added or removed, but not when an existing port is changed.
+
+    :param port_namespace: the port namespace
+    :return: tuple of the name and the description of each port
+    """
+    key = id(port_namespace)
+    cached = _NAMESPACE_FIELDS.get(key)
+
+    if cached is not None:
+        reference, fields = cached
+        if reference() is port_namespace and tuple(name for name, _ in fields) == tuple(port_namespace):
+            return fields
+
+    fields = tuple((name, str(port)) for name, port in port_namespace.items())
+    _NAMESPACE_FIELDS[key] = (weakref.ref(port_namespace, lambda _: _NAMESPACE_FIELDS.pop(key, None)), fields)
+
+    return fields
+
+
+@functools.lru_cache(maxsize=512)
+def _get_dynamic_class(base_class: type, fields: Tuple[Tuple[str, str], ...]) -> type:
+    """Return a subclass of the given builder namespace class with a get and set property for each field.
+
+    :param base_class: the ``ProcessBuilderNamespace`` class to derive from
+    :param fields: tuple of the name and the description of each port of the namespace
+    :return: the subclass with the dynamic properties
+    """
+    dynamic_properties = {}
+
+    # The name has to be passed to the defined functions as default for their argument, because this way the content at
+    # the time of defining the method is saved. If it is used directly in the body, it will try to capture the value
+    # from its enclosing scope at the time of being called. The port itself is looked up when the property is accessed,
+    # since the same class is shared by namespaces of different port namespaces with the same ports.
+    for name, description in fields:
+
+        def fgetter(self, name=name):
+            if name in self._data:
+                return self._data[name]
+
+            port = self._port_namespace[name]
+
+            if not isinstance(port, PortNamespace) and port.has_default():
+                return port.default
+
+            return None
+
+        def fsetter(self, value, name=name):
+            self._data[name] = value
+
+        fgetter.__doc__ = description
+        getter = property(fgetter)
+        getter.setter(fsetter)  # pylint: disable=too-many-function-args
+        dynamic_properties[name] = getter
+
+    class_name = f'{base_class.__name__}-{uuid4()}'
+    return type(class_name, (base_class,), dynamic_properties)
+
 
 class ProcessBuilderNamespace(collections.abc.MutableMapping):
     """Input namespace for the `ProcessBuilder`.
@@ -39,48 +107,19 @@ class ProcessBuilderNamespace(collections.abc.MutableMapping):
         """
         # pylint: disable=super-init-not-called
         self._port_namespace = port_namespace
-        self._valid_fields = []
+        self._valid_fields = list(port_namespace)
         self._data = {}
 
-        dynamic_properties = {}
-
-        # The name and port objects have to be passed to the defined functions as defaults for
-        # their arguments, because this way the content at the time of defining the method is
-        # saved. If they are used directly in the body, it will try to capture the value from
-        # its enclosing scope at the time of being called.
         for name, port in port_namespace.items():
-
-            self._valid_fields.append(name)
-
             if isinstance(port, PortNamespace):
                 self._data[name] = ProcessBuilderNamespace(port)
 
-                def fgetter(self, name=name):
-                    return self._data.get(name)
-            elif port.has_default():
-
-                def fgetter(self, name=name, default=port.default):  # type: ignore # pylint: disable=cell-var-from-loop
-                    return self._data.get(name, default)
-            else:
-
-                def fgetter(self, name=name):
-                    return self._data.get(name, None)
-
-            def fsetter(self, value, name=name):
-                self._data[name] = value
-
-            fgetter.__doc__ = str(port)
-            getter = property(fgetter)
-            getter.setter(fsetter)  # pylint: disable=too-many-function-args
-            dynamic_properties[name] = getter
-
         # The dynamic property can only be attached to a class and not an instance, however, we cannot attach it to
         # the ``ProcessBuilderNamespace`` class since it would interfere with other instances that may already
-        # exist. The workaround is to create a new class on the fly that derives from ``ProcessBuilderNamespace``
-        # and add the dynamic property to that instead
-        class_name = f'{self.__class__.__name__}-{uuid4()}'
-        child_class = type(class_name, (self.__class__,), dynamic_properties)
-        self.__class__ = child_class
+        # exist. The workaround is to use a class that derives from ``ProcessBuilderNamespace`` and add the dynamic
+        # property to that instead. Since the properties only depend on the names and descriptions of the ports, the
+        # class is created once and then reused for all namespaces with the same ports.
+        self.__class__ = _get_dynamic_class(self.__class__, _get_fields(port_namespace))
 
     def __setattr__(self, attr: str, value: Any) -> None:
         """Assign the given value to the port with key `attr`.
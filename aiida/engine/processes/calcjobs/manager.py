@@ -57,7 +57,6 @@ class JobsList:
         self._loop = transport_queue.loop
         self._logger = logging.getLogger(__name__)
 
-        self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
         self._last_updated = last_updated
         self._update_handle: Optional[asyncio.TimerHandle] = None
@@ -128,8 +127,10 @@ class JobsList:
             if not self._update_requests_outstanding():
                 return
 
-            # Update our cache of the job states
-            self._jobs_cache = await self._get_jobs_from_scheduler()
+            # The job states are only needed to resolve the pending requests, so they are not kept on the instance. When
+            # querying by user, the response can contain many jobs not submitted through AiiDA, which would otherwise be
+            # kept in memory for the entire lifetime of the daemon worker.
+            jobs_info = await self._get_jobs_from_scheduler()
         except Exception as exception:
             # Set the exception on all the update futures
             for future in self._job_update_requests.values():
@@ -146,7 +147,7 @@ class JobsList:
         else:
             for job_id, future in self._job_update_requests.items():
                 if not future.done():
-                    future.set_result(self._jobs_cache.get(job_id, None))
+                    future.set_result(jobs_info.get(job_id, None))
         finally:
             self._job_update_requests = {}
 
@@ -159,8 +160,10 @@ class JobsList:
         :param job_id: job identifier
         :return: future that will resolve to a `JobInfo` object when the job changes state
         """
-        # Get or create the future
-        request = self._job_update_requests.setdefault(job_id, asyncio.Future())
+        # Get or create the future, where the future is only constructed if there is no pending request for the job yet
+        request = self._job_update_requests.get(job_id)
+        if request is None:
+            request = self._job_update_requests[job_id] = asyncio.Future()
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
         try:
@@ -243,7 +246,7 @@ class JobsList:
         :return: the list of jobs with the scheduler
         :rtype: list
         """
-        return [str(job_id) for job_id, _ in self._job_update_requests.items()]
+        return [str(job_id) for job_id in self._job_update_requests]
 
 
 class JobManager:
@@ -263,7 +266,7 @@ class JobManager:
 
     def __init__(self, transport_queue: 'TransportQueue') -> None:
         self._transport_queue = transport_queue
-        self._job_lists: Dict[Hashable, 'JobInfo'] = {}
+        self._job_lists: Dict[Hashable, JobsList] = {}
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
         """Get or create a new `JobLists` instance for the given authinfo.
@@ -271,10 +274,12 @@ class JobManager:
         :param authinfo: the `AuthInfo`
         :return: a `JobsList` instance
         """
-        if authinfo.id not in self._job_lists:
-            self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue)
+        jobs_list = self._job_lists.get(authinfo.id)
 
-        return self._job_lists[authinfo.id]
+        if jobs_list is None:
+            jobs_list = self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue)
+
+        return jobs_list
 
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo: AuthInfo, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
@@ -304,9 +304,8 @@ class FunctionProcess(Process):
         """Create the input args for the FunctionProcess."""
         cls.validate_inputs(*args, **kwargs)
 
-        ins = {}
-        if kwargs:
-            ins.update(kwargs)
+        # The keyword arguments are collected in a new dictionary for each call, so it can be extended directly
+        ins = kwargs
         if args:
             ins.update(cls.args_to_dict(*args))
         return ins
@@ -321,7 +320,7 @@ class FunctionProcess(Process):
         :return: A label -> value dictionary
 
         """
-        return dict(list(zip(cls._func_args, args)))
+        return dict(zip(cls._func_args, args))
 
     @classmethod
     def get_or_create_db_record(cls) -> 'ProcessNode':
@@ -376,20 +375,23 @@ class FunctionProcess(Process):
 
         # Split the inputs into positional and keyword arguments
         args = [None] * len(self._func_args)
+        positions = {name: index for index, name in enumerate(self._func_args)}
         kwargs = {}
+        ports = self.spec().inputs
 
         for name, value in (self.inputs or {}).items():
-            try:
-                if self.spec().inputs[name].non_db:  # type: ignore[union-attr]
-                    # Don't consider non-database inputs
-                    continue
-            except KeyError:
-                pass  # No port found
+            port = ports.get(name)
+
+            # Don't consider non-database inputs
+            if port is not None and port.non_db:  # type: ignore[union-attr]
+                continue
 
             # Check if it is a positional arg, if not then keyword
-            try:
-                args[self._func_args.index(name)] = value
-            except ValueError:
+            position = positions.get(name)
+
+            if position is not None:
+                args[position] = value
+            else:
                 kwargs[name] = value
 
         result = self._func(*args, **kwargs)
@@ -28,6 +28,10 @@ PORT_NAME_MAX_CONSECUTIVE_UNDERSCORES = 1  # pylint: disable=invalid-name
 PORT_NAMESPACE_SEPARATOR = '__'  # The character sequence to represent a nested port namespace in a flat link label
 OutputPort = ports.OutputPort  # pylint: disable=invalid-name
 
+# Matches all groups of consecutive underscores where each group will be of the form `('___', '_')`, where the first
+# element is the matched group of consecutive underscores.
+CONSECUTIVE_UNDERSCORES = re.compile(r'((_)\2+)')
+
 
 class WithNonDb:
     """
@@ -185,9 +189,7 @@ class PortNamespace(WithNonDb, ports.PortNamespace):
         except ValueError as exception:
             raise ValueError(f'invalid port name `{port_name}`: {exception}')
 
-        # Following regexes will match all groups of consecutive underscores where each group will be of the form
-        # `('___', '_')`, where the first element is the matched group of consecutive underscores.
-        consecutive_underscores = [match[0] for match in re.findall(r'((_)\2+)', port_name)]
+        consecutive_underscores = [match[0] for match in CONSECUTIVE_UNDERSCORES.findall(port_name)]
 
         if any(len(entry) > PORT_NAME_MAX_CONSECUTIVE_UNDERSCORES for entry in consecutive_underscores):
             raise ValueError(f'invalid port name `{port_name}`: more than two consecutive underscores')
@@ -12,13 +12,12 @@ import asyncio
 import collections
 from collections.abc import Mapping
 import enum
-import inspect
 import logging
-from uuid import UUID
+import sys
 import traceback
 from types import TracebackType
 from typing import (
-    Any, cast, Dict, Iterable, Iterator, List, MutableMapping, Optional, Type, Tuple, Union, TYPE_CHECKING
+    Any, cast, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Type, Tuple, Union, TYPE_CHECKING
 )
 
 from aio_pika.exceptions import ConnectionClosed
@@ -149,6 +148,7 @@ class Process(plumpy.processes.Process):
         )
 
         self._node: Optional[orm.ProcessNode] = None
+        self._linked_output_labels: Optional[Set[str]] = None
         self._parent_pid = parent_pid
         self._enable_persistence = enable_persistence
         if self._enable_persistence and self.runner.persister is None:
@@ -258,10 +258,10 @@ class Process(plumpy.processes.Process):
     def get_provenance_inputs_iterator(self) -> Iterator[Tuple[str, Union[InputPort, PortNamespace]]]:
         """Get provenance input iterator.
 
-        :rtype: filter
+        :return: iterator over the name and value of the inputs whose name does not start with an underscore
         """
         assert self.inputs is not None
-        return filter(lambda kv: not kv[0].startswith('_'), self.inputs.items())
+        return ((name, value) for name, value in self.inputs.items() if not name.startswith('_'))
 
     @override
     def load_instance_state(
@@ -275,6 +275,8 @@ class Process(plumpy.processes.Process):
         """
         from aiida.manage import manager
 
+        self._linked_output_labels = None
+
         if 'runner' in load_context:
             self._runner = load_context.runner
         else:
@@ -369,7 +371,7 @@ class Process(plumpy.processes.Process):
         """Called when a Process is created."""
         super().on_create()
         # If parent PID hasn't been supplied try to get it from the stack
-        if self._parent_pid is None and Process.current():
+        if self._parent_pid is None:
             current = Process.current()
             if isinstance(current, Process):
                 self._parent_pid = current.pid  # type: ignore[assignment]
@@ -415,7 +417,10 @@ class Process(plumpy.processes.Process):
         """
         super().on_except(exc_info)
         self.node.set_exception(''.join(traceback.format_exception(exc_info[0], exc_info[1], None)).rstrip())
-        self.report(''.join(traceback.format_exception(*exc_info)))
+
+        # Formatting the full stack trace is only worth it if the report is actually going to be emitted
+        if self.logger.isEnabledFor(LOG_LEVEL_REPORT):
+            self.report(''.join(traceback.format_exception(*exc_info)))
 
     @override
     def on_finish(self, result: Union[int, ExitCode], successful: bool) -> None:
@@ -513,6 +518,11 @@ class Process(plumpy.processes.Process):
         if self._parent_pid is None:
             return None
 
+        # The parent is typically the process that is currently running, in which case its node is already in memory
+        current = Process.current()
+        if isinstance(current, Process) and current.pid == self._parent_pid:
+            return current.node
+
         return orm.load_node(pk=self._parent_pid)
 
     @classmethod
@@ -549,10 +559,18 @@ class Process(plumpy.processes.Process):
         :param kwargs: kwargs to pass to the log call
 
         """
-        message = f'[{self.node.pk}|{self.__class__.__name__}|{inspect.stack()[1][3]}]: {msg}'
+        # Building the message requires inspecting the stack of the caller, which is pointless if it is not going to be
+        # logged anyway
+        if not self.logger.isEnabledFor(LOG_LEVEL_REPORT):
+            return
+
+        # Only the name of the calling function is needed, so its frame is retrieved directly, since ``inspect.stack``
+        # builds the frame info of the entire stack, including reading the source context of each frame from disk
+        caller = sys._getframe(1).f_code.co_name  # pylint: disable=protected-access
+        message = f'[{self.node.pk}|{self.__class__.__name__}|{caller}]: {msg}'
         self.logger.log(LOG_LEVEL_REPORT, message, *args, **kwargs)
 
-    def _create_and_setup_db_record(self) -> Union[int, UUID]:
+    def _create_and_setup_db_record(self) -> Union[int, str]:
         """
         Create and setup the database record for this process
 
@@ -584,7 +602,8 @@ class Process(plumpy.processes.Process):
         if self.node.pk is not None:
             return self.node.pk
 
-        return UUID(self.node.uuid)
+        # The UUID string is a valid identifier as is, there is no need to parse it into a `uuid.UUID` instance
+        return self.node.uuid
 
     @override
     def encode_input_args(self, inputs: Dict[str, Any]) -> str:  # pylint: disable=no-self-use
@@ -618,21 +637,26 @@ class Process(plumpy.processes.Process):
         if self.metadata.store_provenance is False:
             return
 
-        outputs_flat = self._flat_outputs()
-        outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
-        outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
+        process_node = self.node
+
+        # This is called for every change of the process state, so the labels of the outputs that are already linked
+        # are only retrieved from the database the first time and are then kept up to date here.
+        if self._linked_output_labels is None:
+            outgoing = process_node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN))
+            self._linked_output_labels = set(outgoing.all_link_labels())
 
-        for link_label, output in outputs_flat.items():
+        for link_label, output in self._flat_outputs().items():
 
-            if link_label not in outputs_new:
+            if link_label in self._linked_output_labels:
                 continue
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+            if isinstance(process_node, orm.CalculationNode):
+                output.add_incoming(process_node, LinkType.CREATE, link_label)
+            elif isinstance(process_node, orm.WorkflowNode):
+                output.add_incoming(process_node, LinkType.RETURN, link_label)
 
             output.store()
+            self._linked_output_labels.add(link_label)
 
     def _setup_db_record(self) -> None:
         """
@@ -648,25 +672,28 @@ class Process(plumpy.processes.Process):
         linked up as well.
         """
         assert self.inputs is not None
-        assert not self.node.is_sealed, 'process node cannot be sealed when setting up the database record'
+        process_node = self.node
+        metadata = self.metadata
+
+        assert not process_node.is_sealed, 'process node cannot be sealed when setting up the database record'
 
         # Store important process attributes in the node proxy
-        self.node.set_process_state(None)
-        self.node.set_process_label(self.__class__.__name__)
-        self.node.set_process_type(self.__class__.build_process_type())
+        process_node.set_process_state(None)
+        process_node.set_process_label(self.__class__.__name__)
+        process_node.set_process_type(self.__class__.build_process_type())
 
         parent_calc = self.get_parent_calc()
 
-        if parent_calc and self.metadata.store_provenance:
+        if parent_calc and metadata.store_provenance:
 
             if isinstance(parent_calc, orm.CalculationNode):
                 raise exceptions.InvalidOperation('calling processes from a calculation type process is forbidden.')
 
-            if isinstance(self.node, orm.CalculationNode):
-                self.node.add_incoming(parent_calc, LinkType.CALL_CALC, self.metadata.call_link_label)
+            if isinstance(process_node, orm.CalculationNode):
+                process_node.add_incoming(parent_calc, LinkType.CALL_CALC, metadata.call_link_label)
 
-            elif isinstance(self.node, orm.WorkflowNode):
-                self.node.add_incoming(parent_calc, LinkType.CALL_WORK, self.metadata.call_link_label)
+            elif isinstance(process_node, orm.WorkflowNode):
+                process_node.add_incoming(parent_calc, LinkType.CALL_WORK, metadata.call_link_label)
 
         self._setup_metadata()
         self._setup_inputs()
@@ -694,6 +721,16 @@ class Process(plumpy.processes.Process):
 
     def _setup_inputs(self) -> None:
         """Create the links between the input nodes and the ProcessNode that represents this process."""
+        process_node = self.node
+
+        # Need this special case for tests that use ProcessNodes as classes
+        link_type: Optional[LinkType] = None
+
+        if isinstance(process_node, orm.CalculationNode):
+            link_type = LinkType.INPUT_CALC
+        elif isinstance(process_node, orm.WorkflowNode):
+            link_type = LinkType.INPUT_WORK
+
         for name, node in self._flat_inputs().items():
 
             # Certain processes allow to specify ports with `None` as acceptable values
@@ -701,15 +738,11 @@ class Process(plumpy.processes.Process):
                 continue
 
             # Special exception: set computer if node is a remote Code and our node does not yet have a computer set
-            if isinstance(node, orm.Code) and not node.is_local() and not self.node.computer:
-                self.node.computer = node.get_remote_computer()
+            if isinstance(node, orm.Code) and not node.is_local() and not process_node.computer:
+                process_node.computer = node.get_remote_computer()
 
-            # Need this special case for tests that use ProcessNodes as classes
-            if isinstance(self.node, orm.CalculationNode):
-                self.node.add_incoming(node, LinkType.INPUT_CALC, name)
-
-            elif isinstance(self.node, orm.WorkflowNode):
-                self.node.add_incoming(node, LinkType.INPUT_WORK, name)
+            if link_type is not None:
+                process_node.add_incoming(node, link_type, name)
 
     def _flat_inputs(self) -> Dict[str, Any]:
         """
@@ -722,8 +755,9 @@ class Process(plumpy.processes.Process):
 
         """
         assert self.inputs is not None
-        inputs = {key: value for key, value in self.inputs.items() if key != self.spec().metadata_key}
-        return dict(self._flatten_inputs(self.spec().inputs, inputs))
+        spec = self.spec()
+        inputs = {key: value for key, value in self.inputs.items() if key != spec.metadata_key}
+        return dict(self._flatten_inputs(spec.inputs, inputs))
 
     def _flat_outputs(self) -> Dict[str, Any]:
         """
@@ -762,10 +796,8 @@ class Process(plumpy.processes.Process):
 
                 prefixed_key = parent_name + separator + name if parent_name else name
 
-                try:
-                    nested_port = cast(Union[InputPort, PortNamespace], port[name]) if port else None
-                except (KeyError, TypeError):
-                    nested_port = None
+                # Inputs of dynamic namespaces do not have a port, which is looked up without raising an exception
+                nested_port = cast(Union[InputPort, PortNamespace], port.get(name)) if port else None
 
                 sub_items = self._flatten_inputs(
                     port=nested_port, port_value=value, parent_name=prefixed_key, separator=separator
@@ -803,10 +835,8 @@ class Process(plumpy.processes.Process):
 
                 prefixed_key = parent_name + separator + name if parent_name else name
 
-                try:
-                    nested_port = cast(Union[OutputPort, PortNamespace], port[name]) if port else None
-                except (KeyError, TypeError):
-                    nested_port = None
+                # Outputs of dynamic namespaces do not have a port, which is looked up without raising an exception
+                nested_port = cast(Union[OutputPort, PortNamespace], port.get(name)) if port else None
 
                 sub_items = self._flatten_outputs(
                     port=nested_port, port_value=value, parent_name=prefixed_key, separator=separator
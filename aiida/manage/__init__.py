@@ -51,6 +51,7 @@ __all__ = (
     'config_schema',
     'disable_caching',
     'enable_caching',
+    'get_cache_matcher',
     'get_current_version',
     'get_manager',
     'get_option',
@@ -13,6 +13,7 @@ import keyword
 from enum import Enum
 from collections import namedtuple
 from contextlib import contextmanager, suppress
+from functools import lru_cache
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
@@ -20,7 +21,7 @@ from aiida.manage.configuration import get_config_option
 
 from aiida.plugins.entry_point import ENTRY_POINT_STRING_SEPARATOR, ENTRY_POINT_GROUP_TO_MODULE_PATH_MAP
 
-__all__ = ('get_use_cache', 'enable_caching', 'disable_caching')
+__all__ = ('get_use_cache', 'get_cache_matcher', 'enable_caching', 'disable_caching')
 
 
 class ConfigKeys(Enum):
@@ -147,50 +148,67 @@ def get_use_cache(*, identifier=None):
         configuration error, or by defining the class both enabled and disabled
     """
     type_check(identifier, str, allow_none=True)
+    return get_cache_matcher()(identifier)
 
+
+def get_cache_matcher():
+    """Return a callable that determines whether caching should be used for a given process type.
+
+    The caching configuration is loaded and validated only once, when this function is called. The returned callable
+    can therefore be used to efficiently check a large number of identifiers against the same configuration.
+
+    :return: callable that takes an optional process type string and returns True if caching is enabled, else False
+    :raises: `~aiida.common.exceptions.ConfigurationError` if the configuration is invalid
+    """
     default, enabled, disabled = _CONTEXT_CACHE.get_options()
 
-    if identifier is not None:
-        type_check(identifier, str)
-
-        enable_matches = [pattern for pattern in enabled if _match_wildcard(string=identifier, pattern=pattern)]
-        disable_matches = [pattern for pattern in disabled if _match_wildcard(string=identifier, pattern=pattern)]
-
-        if enable_matches and disable_matches:
-            # If both enable and disable have matching identifier, we search for
-            # the most specific one. This is determined by checking whether
-            # all other patterns match the specific pattern.
-            PatternWithResult = namedtuple('PatternWithResult', ['pattern', 'use_cache'])
-            most_specific = []
-            for specific_pattern in enable_matches:
-                if all(
-                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
-                    for other_pattern in enable_matches + disable_matches
-                ):
-                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=True))
-            for specific_pattern in disable_matches:
-                if all(
-                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
-                    for other_pattern in enable_matches + disable_matches
-                ):
-                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=False))
-
-            if len(most_specific) > 1:
-                raise exceptions.ConfigurationError((
-                    'Invalid configuration: multiple matches for identifier {}'
-                    ', but the most specific identifier is not unique. Candidates: {}'
-                ).format(identifier, [match.pattern for match in most_specific]))
-            if not most_specific:
-                raise exceptions.ConfigurationError(
-                    'Invalid configuration: multiple matches for identifier {}, but none of them is most specific.'.
-                    format(identifier)
-                )
-            return most_specific[0].use_cache
-        if enable_matches:
-            return True
-        if disable_matches:
-            return False
-    return default
+    def use_cache(identifier=None):
+        """Return whether caching should be used for the given process type.
+
+        :param identifier: Process type string of the node
+        :raises: `~aiida.common.exceptions.ConfigurationError` if the class is both enabled and disabled
+        """
+        if identifier is not None:
+            enable_matches = [pattern for pattern in enabled if _match_wildcard(string=identifier, pattern=pattern)]
+            disable_matches = [pattern for pattern in disabled if _match_wildcard(string=identifier, pattern=pattern)]
+
+            if enable_matches and disable_matches:
+                # If both enable and disable have matching identifier, we search for
+                # the most specific one. This is determined by checking whether
+                # all other patterns match the specific pattern.
+                PatternWithResult = namedtuple('PatternWithResult', ['pattern', 'use_cache'])
+                most_specific = []
+                for specific_pattern in enable_matches:
+                    if all(
+                        _match_wildcard(string=specific_pattern, pattern=other_pattern)
+                        for other_pattern in enable_matches + disable_matches
+                    ):
+                        most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=True))
+                for specific_pattern in disable_matches:
+                    if all(
+                        _match_wildcard(string=specific_pattern, pattern=other_pattern)
+                        for other_pattern in enable_matches + disable_matches
+                    ):
+                        most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=False))
+
+                if len(most_specific) > 1:
+                    raise exceptions.ConfigurationError((
+                        'Invalid configuration: multiple matches for identifier {}'
+                        ', but the most specific identifier is not unique. Candidates: {}'
+                    ).format(identifier, [match.pattern for match in most_specific]))
+                if not most_specific:
+                    raise exceptions.ConfigurationError(
+                        'Invalid configuration: multiple matches for identifier {}, but none of them is most specific.'.
+                        format(identifier)
+                    )
+                return most_specific[0].use_cache
+            if enable_matches:
+                return True
+            if disable_matches:
+                return False
+        return default
+
+    return use_cache
 
 
 def _match_wildcard(*, string, pattern):
@@ -198,8 +216,13 @@ def _match_wildcard(*, string, pattern):
     Helper function to check whether a given name matches a pattern
     which can contain '*' wildcards.
     """
-    regexp = '.*'.join(re.escape(part) for part in pattern.split('*'))
-    return re.fullmatch(pattern=regexp, string=string) is not None
+    return _compile_wildcard(pattern).fullmatch(string) is not None
+
+
+@lru_cache(maxsize=None)
+def _compile_wildcard(pattern):
+    """Return the compiled regular expression corresponding to a pattern which can contain '*' wildcards."""
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')))
 
 
 def _validate_identifier_pattern(*, identifier):
@@ -35,6 +35,19 @@ def config_schema() -> Dict[str, Any]:
     return json.loads(resources.read_text(schema_module, SCHEMA_FILE, encoding='utf8'))
 
 
+@lru_cache(1)
+def config_validator() -> Any:
+    """Return the validator for the configuration schema.
+
+    .. note:: the result is cached, since ``jsonschema.validate`` checks the schema against its meta-schema and
+        constructs a new validator on every call.
+    """
+    schema = config_schema()
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 class ConfigValidationError(ConfigurationError):
     """Configuration error raised when the file contents fails validation."""
 
@@ -124,9 +137,8 @@ class Config:  # pylint: disable=too-many-public-methods
     @staticmethod
     def validate(config: dict, filepath: Optional[str] = None):
         """Validate a configuration dictionary."""
-        try:
-            jsonschema.validate(instance=config, schema=config_schema())
-        except jsonschema.ValidationError as error:
+        error = jsonschema.exceptions.best_match(config_validator().iter_errors(config))
+        if error is not None:
             raise ConfigValidationError(
                 message=error.message, keypath=error.path, schema=error.schema, filepath=filepath
             )
@@ -489,28 +501,31 @@ class Config:  # pylint: disable=too-many-public-methods
 
         :return: self
         """
-        from aiida.common.files import md5_from_filelike, md5_file
-        from .settings import DEFAULT_CONFIG_INDENT_SIZE
+        import hashlib
 
-        # If the filepath of this configuration does not yet exist, simply write it.
-        if not os.path.isfile(self.filepath):
-            self._atomic_write()
-            return self
+        from aiida.common.files import md5_file
 
-        # Otherwise, we write the content to a temporary file and compare its md5 checksum with the current config on
-        # disk. When the checksums differ, we first create a backup and only then overwrite the existing file.
-        with tempfile.NamedTemporaryFile() as handle:
-            json.dump(self.dictionary, handle, indent=DEFAULT_CONFIG_INDENT_SIZE)
-            handle.seek(0)
+        # Serialize the config only once: the same content is used for the checksum comparison and to write to disk.
+        content = self._serialize()
 
-            if md5_from_filelike(handle) != md5_file(self.filepath):
-                self._backup(self.filepath)
+        # If the configuration file already exists on disk, compare the md5 checksum of its contents with those in
+        # memory. When the checksums differ, we first create a backup and only then overwrite the existing file.
+        if os.path.isfile(self.filepath) and hashlib.md5(content).hexdigest() != md5_file(self.filepath):
+            self._backup(self.filepath)
 
-        self._atomic_write()
+        self._atomic_write(content=content)
 
         return self
 
-    def _atomic_write(self, filepath=None):
+    def _serialize(self) -> bytes:
+        """Return the config as it is in memory, i.e. the contents of ``self.dictionary``, serialized as JSON.
+
+        :return: the UTF-8 encoded JSON serialization of the config
+        """
+        from .settings import DEFAULT_CONFIG_INDENT_SIZE
+        return json.dumps(self.dictionary, indent=DEFAULT_CONFIG_INDENT_SIZE).encode('utf8')
+
+    def _atomic_write(self, filepath=None, content=None):
         """Write the config as it is in memory, i.e. the contents of ``self.dictionary``, to disk.
 
         .. note:: this command will write the config from memory to a temporary file in the same directory as the
@@ -519,8 +534,12 @@ class Config:  # pylint: disable=too-many-public-methods
             of being atomic within the limitations of the application.
 
         :param filepath: optional filepath to write the contents to, if not specified, the default filename is used.
+        :param content: optional serialized config as returned by ``_serialize``, if not specified it is computed.
         """
-        from .settings import DEFAULT_UMASK, DEFAULT_CONFIG_INDENT_SIZE
+        from .settings import DEFAULT_UMASK
+
+        if content is None:
+            content = self._serialize()
 
         umask = os.umask(DEFAULT_UMASK)
 
@@ -532,7 +551,7 @@ class Config:  # pylint: disable=too-many-public-methods
         # temporary file, we should also tell the tempfile to not be automatically deleted as that will raise.
         with tempfile.NamedTemporaryFile(dir=os.path.dirname(filepath), delete=False) as handle:
             try:
-                json.dump(self.dictionary, handle, indent=DEFAULT_CONFIG_INDENT_SIZE)
+                handle.write(content)
             finally:
                 os.umask(umask)
 
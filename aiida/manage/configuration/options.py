@@ -8,7 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Definition of known configuration options and methods to parse and get option values."""
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import jsonschema
 
@@ -25,6 +26,7 @@ class Option:
     def __init__(self, name: str, schema: Dict[str, Any]):
         self._name = name
         self._schema = schema
+        self._validator: Optional[Any] = None
 
     def __str__(self) -> str:
         return f'Option(name={self._name})'
@@ -53,6 +55,19 @@ class Option:
     def global_only(self) -> bool:
         return self._schema.get('global_only', False)
 
+    @property
+    def validator(self) -> Any:
+        """Return the validator for the schema of this option.
+
+        .. note:: the validator is created once, since ``jsonschema.validate`` checks the schema itself and constructs
+            a new validator on every call.
+        """
+        if self._validator is None:
+            validator_class = jsonschema.validators.validator_for(self._schema)
+            validator_class.check_schema(self._schema)
+            self._validator = validator_class(self._schema)
+        return self._validator
+
     def validate(self, value: Any, cast: bool = True) -> Any:
         """Validate a value
 
@@ -88,10 +103,11 @@ class Option:
             except ValueError:
                 pass
 
-        try:
-            jsonschema.validate(instance=value, schema=self.schema)
-        except jsonschema.ValidationError as exc:
-            raise ConfigValidationError(message=exc.message, keypath=[self.name, *(exc.path or [])], schema=exc.schema)
+        error = jsonschema.exceptions.best_match(self.validator.iter_errors(value))
+        if error is not None:
+            raise ConfigValidationError(
+                message=error.message, keypath=[self.name, *(error.path or [])], schema=error.schema
+            )
 
         # special caching validation
         if self.name in ('caching.enabled_for', 'caching.disabled_for'):
@@ -116,8 +132,12 @@ def get_option_names() -> List[str]:
     return list(get_schema_options())
 
 
+@lru_cache(maxsize=None)
 def get_option(name: str) -> Option:
-    """Return option."""
+    """Return option.
+
+    .. note:: the result is cached, since the schema is fixed and ``Option`` instances are effectively immutable.
+    """
     options = get_schema_options()
     if name not in options:
         raise ConfigurationError(f'the option {name} does not exist')
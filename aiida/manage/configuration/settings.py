@@ -42,6 +42,11 @@ def create_instance_directories():
     directory_daemon = directory_base / DAEMON_DIR
     directory_daemon_log = directory_base / DAEMON_LOG_DIR
 
+    # The daemon log directory is nested in the others, so if it exists, all directories exist and nothing has to be
+    # done. This is the case for all but the first invocation, for which it saves a number of filesystem calls.
+    if directory_daemon_log.is_dir():
+        return
+
     umask = os.umask(DEFAULT_UMASK)
 
     try:
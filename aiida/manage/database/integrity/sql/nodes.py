@@ -43,19 +43,21 @@ def format_type_string_regex(node_class):
 
 
 VALID_NODE_BASE_CLASSES = [Data, CalculationNode, WorkflowNode]
-VALID_NODE_TYPE_STRING = f"({'|'.join([format_type_string_regex(cls) for cls in VALID_NODE_BASE_CLASSES])})%"
+VALID_NODE_TYPE_PATTERNS = [f'{format_type_string_regex(cls)}%' for cls in VALID_NODE_BASE_CLASSES]
 
+# The valid types are matched as prefixes with `LIKE`, which unlike `SIMILAR TO` does not have to be translated into a
+# regular expression that is then evaluated for every row
 SELECT_NODES_WITH_INVALID_TYPE = """
     SELECT node.id, node.uuid, node.node_type
     FROM db_dbnode AS node
-    WHERE node.node_type NOT SIMILAR TO %(valid_node_types)s;
+    WHERE NOT node.node_type LIKE ANY(%(valid_node_types)s);
     """
 
 INVALID_NODE_SELECT_STATEMENTS = (
     AttributeDict({
         'sql': SELECT_NODES_WITH_INVALID_TYPE,
         'parameters': {
-            'valid_node_types': VALID_NODE_TYPE_STRING
+            'valid_node_types': VALID_NODE_TYPE_PATTERNS
         },
         'headers': ['ID', 'UUID', 'Type'],
         'message': 'detected nodes with invalid type'
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""SQL statements that summarise the contents of the database."""
+
+SELECT_ENTITY_COUNTS = """
+    SELECT 'Users', COUNT(*) FROM db_dbuser
+    UNION ALL SELECT 'Computers', COUNT(*) FROM db_dbcomputer
+    UNION ALL SELECT 'Nodes', COUNT(*) FROM db_dbnode
+    UNION ALL SELECT 'Groups', COUNT(*) FROM db_dbgroup
+    UNION ALL SELECT 'Comments', COUNT(*) FROM db_dbcomment
+    UNION ALL SELECT 'Logs', COUNT(*) FROM db_dblog;
+    """
+
+# The distinct node and process types are collected with a "loose index scan": instead of scanning the entire node
+# table, the index on the column is used to jump from one distinct value to the next, which only costs one index lookup
+# per distinct value. The recursion terminates when the subquery returns ``NULL``, i.e. there is no larger value.
+SELECT_DISTINCT_ENTITY_PROPERTIES = """
+    WITH RECURSIVE node_types AS (
+        (SELECT node_type FROM db_dbnode ORDER BY node_type LIMIT 1)
+        UNION ALL
+        SELECT (SELECT node_type FROM db_dbnode WHERE node_type > n.node_type ORDER BY node_type LIMIT 1)
+        FROM node_types AS n WHERE n.node_type IS NOT NULL
+    ), process_types AS (
+        (SELECT process_type FROM db_dbnode WHERE process_type IS NOT NULL ORDER BY process_type LIMIT 1)
+        UNION ALL
+        SELECT (SELECT process_type FROM db_dbnode WHERE process_type > p.process_type ORDER BY process_type LIMIT 1)
+        FROM process_types AS p WHERE p.process_type IS NOT NULL
+    )
+    SELECT
+        (SELECT array_agg(DISTINCT email) FROM db_dbuser),
+        (SELECT array_agg(DISTINCT label) FROM db_dbcomputer),
+        (SELECT array_agg(node_type) FROM node_types WHERE node_type IS NOT NULL),
+        (SELECT array_agg(process_type) FROM process_types WHERE process_type IS NOT NULL),
+        (SELECT array_agg(DISTINCT type_string) FROM db_dbgroup);
+    """
@@ -31,6 +31,15 @@ class AuthInfo(entities.Entity):
             """
             self._backend.authinfos.delete(pk)
 
+        def get_many(self, pairs):
+            """Return the entries that are configured for the given computer and user pairs with a single query.
+
+            :param pairs: iterable of tuples ``(computer_pk, user_pk)``
+            :return: dictionary mapping each pair for which an entry exists onto its `AuthInfo` instance
+            """
+            authinfos = self._backend.authinfos.get_many(pairs)
+            return {pair: AuthInfo.from_backend_entity(authinfo) for pair, authinfo in authinfos.items()}
+
     PROPERTY_WORKDIR = 'workdir'
 
     def __init__(self, computer, user, backend=None):
@@ -119,6 +128,15 @@ class AuthInfo(entities.Entity):
         """
         self._backend_entity.set_metadata(metadata)
 
+    def set_fields(self, enabled=None, auth_params=None, metadata=None):
+        """Set multiple fields at once, such that they are written to the database with a single update.
+
+        :param enabled: optional boolean, True to enable the instance, False to disable it
+        :param auth_params: optional dictionary with authentication parameters
+        :param metadata: optional dictionary with metadata
+        """
+        self._backend_entity.set_fields(enabled=enabled, auth_params=auth_params, metadata=metadata)
+
     def get_workdir(self):
         """Return the working directory.
 
@@ -128,7 +146,7 @@ class AuthInfo(entities.Entity):
         :rtype: str
         """
         try:
-            return self.get_metadata()[self.PROPERTY_WORKDIR]
+            return self._backend_entity.get_metadata_key(self.PROPERTY_WORKDIR)
         except KeyError:
             return self.computer.get_workdir()
 
@@ -81,6 +81,41 @@ class BackendAuthInfo(BackendEntity):
         :param metadata: a dictionary with metadata
         """
 
+    def set_fields(self, enabled=None, auth_params=None, metadata=None):
+        """Set multiple fields of this instance at once.
+
+        Implementations should override this method to write all given fields with a single database update.
+
+        :param enabled: optional boolean, True to enable the instance, False to disable it
+        :param auth_params: optional dictionary with authentication parameters
+        :param metadata: optional dictionary with metadata
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if auth_params is not None:
+            self.set_auth_params(auth_params)
+        if metadata is not None:
+            self.set_metadata(metadata)
+
+    def get_metadata_key(self, key):
+        """Return the value of a single key of the metadata
+
+        :param key: the metadata key
+        :return: the value of the key
+        :raises KeyError: if the key does not exist in the metadata
+        """
+        return (self.get_metadata() or {})[key]
+
+    def set_metadata_key(self, key, value):
+        """Set the value of a single key of the metadata
+
+        :param key: the metadata key
+        :param value: the value to set, which should be JSON-serializable
+        """
+        metadata = dict(self.get_metadata() or {})
+        metadata[key] = value
+        self.set_metadata(metadata)
+
 
 class BackendAuthInfoCollection(BackendCollection[BackendAuthInfo]):
     """The collection of backend `AuthInfo` entries."""
@@ -104,3 +139,12 @@ class BackendAuthInfoCollection(BackendCollection[BackendAuthInfo]):
         :raise aiida.common.exceptions.NotExistent: if no entry exists for the computer/user pair
         :raise aiida.common.exceptions.MultipleObjectsError: if multiple entries exist for the computer/user pair
         """
+
+    @abc.abstractmethod
+    def get_many(self, pairs):
+        """Return the entries from the collection that are configured for the given computer and user pairs
+
+        :param pairs: iterable of tuples ``(computer_pk, user_pk)``
+        :return: dictionary mapping each pair for which an entry exists onto its
+            :class:`aiida.orm.implementation.authinfos.BackendAuthInfo`
+        """
@@ -9,8 +9,14 @@
 ###########################################################################
 """Module for the Django backend implementation of the `AuthInfo` ORM class."""
 
+import json
+
+# pylint: disable=import-error,no-name-in-module
+from django.db.models.expressions import RawSQL
+
 from aiida.backends.djsite.db.models import DbAuthInfo
 from aiida.common import exceptions
+from aiida.common.json import JSONEncoder
 from aiida.common.lang import type_check
 
 from ..authinfos import BackendAuthInfo, BackendAuthInfoCollection
@@ -23,6 +29,10 @@ class DjangoAuthInfo(entities.DjangoModelEntity[DbAuthInfo], BackendAuthInfo):
 
     MODEL_CLASS = DbAuthInfo
 
+    # The computer and user of an instance cannot be changed, so their backend entities are cached on first access
+    _computer = None
+    _user = None
+
     def __init__(self, backend, computer, user):
         """Construct a new instance.
 
@@ -36,6 +46,8 @@ class DjangoAuthInfo(entities.DjangoModelEntity[DbAuthInfo], BackendAuthInfo):
         type_check(user, users.DjangoUser)
         type_check(computer, computers.DjangoComputer)
         self._dbmodel = utils.ModelWrapper(DbAuthInfo(dbcomputer=computer.dbmodel, aiidauser=user.dbmodel))
+        self._computer = computer
+        self._user = user
 
     @property
     def id(self):  # pylint: disable=invalid-name
@@ -80,7 +92,9 @@ class DjangoAuthInfo(entities.DjangoModelEntity[DbAuthInfo], BackendAuthInfo):
 
         :return: :class:`aiida.orm.implementation.computers.BackendComputer`
         """
-        return self.backend.computers.from_dbmodel(self._dbmodel.dbcomputer)
+        if self._computer is None:
+            self._computer = self.backend.computers.from_dbmodel(self._dbmodel.dbcomputer)
+        return self._computer
 
     @property
     def user(self):
@@ -88,7 +102,9 @@ class DjangoAuthInfo(entities.DjangoModelEntity[DbAuthInfo], BackendAuthInfo):
 
         :return: :class:`aiida.orm.implementation.users.BackendUser`
         """
-        return self._backend.users.from_dbmodel(self._dbmodel.aiidauser)
+        if self._user is None:
+            self._user = self._backend.users.from_dbmodel(self._dbmodel.aiidauser)
+        return self._user
 
     def get_auth_params(self):
         """Return the dictionary of authentication parameters
@@ -118,6 +134,55 @@ class DjangoAuthInfo(entities.DjangoModelEntity[DbAuthInfo], BackendAuthInfo):
         """
         self._dbmodel.metadata = metadata
 
+    def set_fields(self, enabled=None, auth_params=None, metadata=None):
+        """Set multiple fields of this instance at once, writing them with a single database update.
+
+        :param enabled: optional boolean, True to enable the instance, False to disable it
+        :param auth_params: optional dictionary with authentication parameters
+        :param metadata: optional dictionary with metadata
+        """
+        fields = {'enabled': enabled, 'auth_params': auth_params, 'metadata': metadata}
+        self._dbmodel.set_fields(**{key: value for key, value in fields.items() if value is not None})
+
+    def get_metadata_key(self, key):
+        """Return the value of a single key of the metadata
+
+        For a stored instance, only the value of the key is fetched from the database instead of the entire metadata.
+
+        :param key: the metadata key
+        :return: the value of the key
+        :raises KeyError: if the key does not exist in the metadata
+        """
+        if not self.is_stored:
+            return super().get_metadata_key(key)
+
+        queryset = DbAuthInfo.objects.filter(pk=self.id)
+        exists, value = queryset.values_list(RawSQL('metadata ? %s', (key,)), RawSQL('metadata -> %s', (key,))).get()
+
+        if not exists:
+            raise KeyError(key)
+
+        return value
+
+    def set_metadata_key(self, key, value):
+        """Set the value of a single key of the metadata
+
+        For a stored instance, the key is updated in place in the database instead of writing the entire metadata.
+
+        :param key: the metadata key
+        :param value: the value to set, which should be JSON-serializable
+        """
+        if not self.is_stored:
+            super().set_metadata_key(key, value)
+            return
+
+        update = json.dumps({key: value}, cls=JSONEncoder)
+        metadata = RawSQL("COALESCE(metadata, '{}'::jsonb) || %s::jsonb", (update,))
+        DbAuthInfo.objects.filter(pk=self.id).update(metadata=metadata)
+
+        # Keep the model instance in sync without fetching the metadata from the database
+        self.dbmodel.metadata = dict(self.dbmodel.metadata or {}, **{key: value})
+
 
 class DjangoAuthInfoCollection(BackendAuthInfoCollection):
     """The collection of Django backend `AuthInfo` entries."""
@@ -156,5 +221,35 @@ class DjangoAuthInfoCollection(BackendAuthInfoCollection):
             raise exceptions.MultipleObjectsError(
                 f'User<{user.email}> has multiple configurations for Computer<{computer.label}>'
             )
-        else:
-            return self.from_dbmodel(authinfo)
+
+        # The computer and user are already known, so set them directly such that they are not loaded again
+        authinfo = self.from_dbmodel(authinfo)
+        authinfo._computer = computer  # pylint: disable=protected-access
+        authinfo._user = user  # pylint: disable=protected-access
+
+        return authinfo
+
+    def get_many(self, pairs):
+        """Return the entries from the collection that are configured for the given computer and user pairs
+
+        :param pairs: iterable of tuples ``(computer_pk, user_pk)``
+        :return: dictionary mapping each pair for which an entry exists onto its
+            :class:`aiida.orm.implementation.authinfos.BackendAuthInfo`
+        """
+        pairs = set(pairs)
+
+        if not pairs:
+            return {}
+
+        # Django does not support filtering on tuples of columns, so the query selects all entries for any of the
+        # computers and users, after which those that do not correspond to one of the requested pairs are discarded.
+        computer_pks, user_pks = zip(*pairs)
+        queryset = DbAuthInfo.objects.filter(dbcomputer_id__in=computer_pks, aiidauser_id__in=user_pks)
+        authinfos = {}
+
+        for authinfo in queryset.select_related('dbcomputer', 'aiidauser'):
+            pair = (authinfo.dbcomputer_id, authinfo.aiidauser_id)
+            if pair in pairs:
+                authinfos[pair] = self.from_dbmodel(authinfo)
+
+        return authinfos
@@ -9,11 +9,17 @@
 ###########################################################################
 """Django implementation of `aiida.orm.implementation.backends.Backend`."""
 from contextlib import contextmanager
+import itertools
 
 # pylint: disable=import-error,no-name-in-module
+from django.db import connection as django_connection
 from django.db import models, transaction
+from django.db.models import prefetch_related_objects
 
+from aiida.backends.djsite import get_scoped_session
 from aiida.backends.djsite.manager import DjangoBackendManager
+from aiida.common.lang import cached_property
+from aiida.common.utils import grouper
 
 from ..sql.backends import SqlBackend
 from . import authinfos
@@ -33,49 +39,45 @@ class DjangoBackend(SqlBackend[models.Model]):
     """Django implementation of `aiida.orm.implementation.backends.Backend`."""
 
     def __init__(self):
-        """Construct the backend instance by initializing all the collections."""
-        self._authinfos = authinfos.DjangoAuthInfoCollection(self)
-        self._comments = comments.DjangoCommentCollection(self)
-        self._computers = computers.DjangoComputerCollection(self)
-        self._groups = groups.DjangoGroupCollection(self)
-        self._logs = logs.DjangoLogCollection(self)
-        self._nodes = nodes.DjangoNodeCollection(self)
+        """Construct the backend instance.
+
+        The collections are only constructed when they are first accessed.
+        """
         self._backend_manager = DjangoBackendManager()
-        self._users = users.DjangoUserCollection(self)
 
     def migrate(self):
         self._backend_manager.migrate()
 
-    @property
+    @cached_property
     def authinfos(self):
-        return self._authinfos
+        return authinfos.DjangoAuthInfoCollection(self)
 
-    @property
+    @cached_property
     def comments(self):
-        return self._comments
+        return comments.DjangoCommentCollection(self)
 
-    @property
+    @cached_property
     def computers(self):
-        return self._computers
+        return computers.DjangoComputerCollection(self)
 
-    @property
+    @cached_property
     def groups(self):
-        return self._groups
+        return groups.DjangoGroupCollection(self)
 
-    @property
+    @cached_property
     def logs(self):
-        return self._logs
+        return logs.DjangoLogCollection(self)
 
-    @property
+    @cached_property
     def nodes(self):
-        return self._nodes
+        return nodes.DjangoNodeCollection(self)
 
     def query(self):
         return querybuilder.DjangoQueryBuilder(self)
 
-    @property
+    @cached_property
     def users(self):
-        return self._users
+        return users.DjangoUserCollection(self)
 
     @staticmethod
     def transaction():
@@ -91,7 +93,6 @@ class DjangoBackend(SqlBackend[models.Model]):
 
         :return: an instance of :class:`sqlalchemy.orm.session.Session`
         """
-        from aiida.backends.djsite import get_scoped_session
         return get_scoped_session()
 
     # Below are abstract methods inherited from `aiida.orm.implementation.sql.backends.SqlBackend`
@@ -100,30 +101,70 @@ class DjangoBackend(SqlBackend[models.Model]):
         """Return a `BackendEntity` instance from a `DbModel` instance."""
         return convert.get_backend_entity(model, self)
 
+    def get_backend_entities(self, models):
+        """Return the `BackendEntity` instances for a sequence of `DbModel` instances.
+
+        The users and computers of the nodes are fetched with a single query each, such that accessing them does not
+        emit a query for every node.
+        """
+        entities = [convert.get_backend_entity(model, self) for model in models]
+        dbnodes = [entity.dbmodel for entity in entities if isinstance(entity, nodes.DjangoNode)]
+        prefetch_related_objects(dbnodes, 'user', 'dbcomputer')
+        return entities
+
+    def iter_query(self, query, chunk_size=1000):
+        """Iterate over the `BackendEntity` instances of a `QuerySet`, loading its models with a server-side cursor."""
+        for models in grouper(chunk_size, query.iterator(chunk_size=chunk_size)):
+            yield from self.get_backend_entities(models)
+
     @contextmanager
-    def cursor(self):
+    def cursor(self, server_side=False):
         """Return a psycopg cursor to be used in a context manager.
 
+        :param server_side: if True, return a named cursor whose result set is kept on the server.
         :return: a psycopg cursor
         :rtype: :class:`psycopg2.extensions.cursor`
         """
+        connection = self.get_connection()
+        cursor = connection.chunked_cursor() if server_side else connection.cursor()
+
         try:
-            yield self.get_connection().cursor()
+            yield cursor
         finally:
-            pass
+            cursor.close()
 
-    def execute_raw(self, query):
+    def execute_raw(self, query, stream=False, arraysize=2000, prepare=False):
         """Execute a raw SQL statement and return the result.
 
         :param query: a string containing a raw SQL statement
+        :param stream: if True, return a generator that fetches the rows from a server-side cursor in batches.
+        :param arraysize: the number of rows fetched per round-trip to the database when streaming.
+        :param prepare: if True, execute the statement through a prepared statement cached for the connection.
         :return: the result of the query
         """
+        if stream:
+            return itertools.chain.from_iterable(self.execute_raw_iter(query, arraysize))
+
         with self.cursor() as cursor:
-            cursor.execute(query)
+            if prepare:
+                self.execute_prepared_raw(cursor, query)
+            else:
+                cursor.execute(query)
             results = cursor.fetchall()
 
         return results
 
+    def execute_raw_iter(self, query, chunk_size=1000):
+        """Execute a raw SQL statement on a server-side cursor and yield the rows in chunks.
+
+        :param query: a string containing a raw SQL statement that returns rows
+        :param chunk_size: the number of rows fetched per round-trip to the database.
+        :return: a generator of lists of at most ``chunk_size`` rows
+        """
+        with self.cursor(server_side=True) as cursor:
+            cursor.execute(query)
+            yield from iter(lambda: cursor.fetchmany(chunk_size), [])
+
     @staticmethod
     def get_connection():
         """
@@ -131,8 +172,6 @@ class DjangoBackend(SqlBackend[models.Model]):
 
         :return: the django connection
         """
-        # pylint: disable=import-error,no-name-in-module
-        from django.db import connection
         # For now we just return the global but if we ever support multiple Django backends
         # being loaded this should be specific to this backend
-        return connection
+        return django_connection
@@ -171,8 +171,7 @@ class DjangoCommentCollection(BackendCommentCollection):
         # Apply filter and delete found entities
         builder = QueryBuilder().append(Comment, filters=filters, project='id').all()
         entities_to_delete = [_[0] for _ in builder]
-        for entity in entities_to_delete:
-            self.delete(entity)
+        models.DbComment.objects.filter(id__in=entities_to_delete).delete()
 
         # Return list of deleted entities' (former) PKs for checking
         return entities_to_delete
@@ -146,8 +146,7 @@ class DjangoLogCollection(BackendLogCollection):
         # Apply filter and delete found entities
         builder = QueryBuilder().append(Log, filters=filters, project='id')
         entities_to_delete = builder.all(flat=True)
-        for entity in entities_to_delete:
-            self.delete(entity)
+        models.DbLog.objects.filter(id__in=entities_to_delete).delete()
 
         # Return list of deleted entities' (former) PKs for checking
         return entities_to_delete
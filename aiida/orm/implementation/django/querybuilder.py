@@ -11,6 +11,7 @@
 from aldjemy import core
 
 from aiida.backends.djsite.db import models
+from aiida.common.lang import cached_property
 from aiida.orm.implementation.sqlalchemy.querybuilder import SqlaQueryBuilder
 
 
@@ -24,39 +25,39 @@ class DjangoQueryBuilder(SqlaQueryBuilder):
     def set_field_mappings(self):
         pass
 
-    @property
+    @cached_property
     def Node(self):
         return models.DbNode.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def Link(self):
         return models.DbLink.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def Computer(self):
         return models.DbComputer.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def User(self):
         return models.DbUser.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def Group(self):
         return models.DbGroup.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def AuthInfo(self):
         return models.DbAuthInfo.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def Comment(self):
         return models.DbComment.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def Log(self):
         return models.DbLog.sa  # pylint: disable=no-member
 
-    @property
+    @cached_property
     def table_groups_nodes(self):
         return core.Cache.meta.tables['db_dbgroup_dbnodes']
 
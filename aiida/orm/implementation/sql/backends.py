@@ -9,7 +9,9 @@
 ###########################################################################
 """Generic backend related objects"""
 import abc
+import hashlib
 import typing
+import weakref
 
 from .. import backends
 
@@ -18,6 +20,10 @@ __all__ = ('SqlBackend',)
 # The template type for the base ORM model type
 ModelType = typing.TypeVar('ModelType')  # pylint: disable=invalid-name
 
+# Names of the statements prepared on each database connection, keyed by the SQL of the statement. Prepared statements
+# live as long as the database session, so the cache is discarded together with the connection it belongs to.
+PREPARED_STATEMENTS = weakref.WeakKeyDictionary()
+
 
 class SqlBackend(typing.Generic[ModelType], backends.Backend):
     """
@@ -39,38 +45,113 @@ class SqlBackend(typing.Generic[ModelType], backends.Backend):
         :rtype: :class:`aiida.orm.implementation.entities.BackendEntity`
         """
 
+    def get_backend_entities(self, models):
+        """
+        Return the backend entities that correspond to the given Model instances
+
+        Implementations can override this method to load the relationships of all the models at once, instead of
+        emitting a separate query for each model when its relationships are accessed.
+
+        :param models: a sequence of ORM model instances to promote to backend instances
+        :return: a list of the backend entities corresponding to the given models
+        """
+        return [self.get_backend_entity(model) for model in models]
+
+    @abc.abstractmethod
+    def iter_query(self, query, chunk_size=1000):
+        """Iterate over the backend entities that correspond to the Model instances returned by a query.
+
+        The models are loaded from the database in chunks of ``chunk_size`` and each chunk is converted with
+        ``get_backend_entities``, such that only a single chunk is kept in memory at a time.
+
+        :param query: a query of ORM model instances, native to the backend
+        :param chunk_size: the number of models that are loaded from the database at a time.
+        :return: a generator of the backend entities corresponding to the models returned by the query
+        """
+
     @abc.abstractmethod
-    def cursor(self):
+    def cursor(self, server_side=False):
         """
         Return a psycopg cursor.  This method should be used as a context manager i.e.::
 
             with backend.cursor():
                 # Do stuff
 
+        :param server_side: if True, return a named cursor whose result set is kept on the server and is only
+            transferred to the client when rows are fetched.
         :return: a psycopg cursor
         :rtype: :class:`psycopg2.extensions.cursor`
         """
 
     @abc.abstractmethod
-    def execute_raw(self, query):
+    def execute_raw(self, query, stream=False, arraysize=2000, prepare=False):
         """Execute a raw SQL statement and return the result.
 
         :param query: a string containing a raw SQL statement
+        :param stream: if True, return an iterator over the rows of ``execute_raw_iter`` with chunks of ``arraysize``
+            rows, instead of loading the entire result set in memory. This only works for statements that return rows.
+        :param arraysize: the number of rows fetched per round-trip to the database when streaming.
+        :param prepare: if True, execute the statement through a prepared statement that is cached for each database
+            connection, such that repeated executions skip the parsing and planning of the query. Only ``SELECT``,
+            ``INSERT``, ``UPDATE``, ``DELETE`` and ``VALUES`` statements can be prepared.
         :return: the result of the query
         """
 
+    @abc.abstractmethod
+    def execute_raw_iter(self, query, chunk_size=1000):
+        """Execute a raw SQL statement and yield the resulting rows in chunks.
+
+        The rows are fetched from a server-side cursor, such that at most ``chunk_size`` rows are kept in memory at a
+        time instead of the entire result set.
+
+        :param query: a string containing a raw SQL statement that returns rows
+        :param chunk_size: the number of rows fetched per round-trip to the database.
+        :return: a generator of lists of at most ``chunk_size`` rows
+        """
+
+    @staticmethod
+    def execute_prepared_raw(cursor, query):
+        """Execute a raw SQL statement on the cursor through a prepared statement.
+
+        The statement is prepared the first time it is executed on the connection of the cursor and the prepared
+        statement is reused for all subsequent executions on that connection.
+
+        :param cursor: a psycopg cursor
+        :param query: a string containing a raw SQL statement without parameters
+        """
+        prepared = PREPARED_STATEMENTS.setdefault(cursor.connection, {})
+
+        try:
+            name = prepared[query]
+        except KeyError:
+            name = f'aiida_{hashlib.md5(query.encode("utf-8")).hexdigest()}'
+            cursor.execute(f'PREPARE {name} AS {query}')
+            prepared[query] = name
+
+        cursor.execute(f'EXECUTE {name}')
+
     def execute_prepared_statement(self, sql, parameters):
         """Execute an SQL statement with optional prepared statements.
 
         :param sql: the SQL statement string
         :param parameters: dictionary to use to populate the prepared statement
         """
+        return self.execute_prepared_statements([(sql, parameters)])[0]
+
+    def execute_prepared_statements(self, statements):
+        """Execute multiple SQL statements with optional prepared statements using a single cursor.
+
+        This avoids opening a new cursor, and potentially a new connection, for each statement.
+
+        :param statements: iterable of tuples ``(sql, parameters)`` with the SQL statement string and the dictionary to
+            use to populate the prepared statement
+        :return: list with, for each statement, the list of rows that it returned
+        """
         results = []
 
         with self.cursor() as cursor:
-            cursor.execute(sql, parameters)
-
-            for row in cursor:
-                results.append(row)
+            for sql, parameters in statements:
+                cursor.execute(sql, parameters)
+                results.append(cursor.fetchall())
 
         return results
@@ -9,6 +9,10 @@
 ###########################################################################
 """Module for the SqlAlchemy backend implementation of the `AuthInfo` ORM class."""
 
+# pylint: disable=import-error,no-name-in-module
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+
 from aiida.backends.sqlalchemy import get_scoped_session
 from aiida.backends.sqlalchemy.models.authinfo import DbAuthInfo
 from aiida.common import exceptions
@@ -24,6 +28,10 @@ class SqlaAuthInfo(entities.SqlaModelEntity[DbAuthInfo], BackendAuthInfo):
 
     MODEL_CLASS = DbAuthInfo
 
+    # The computer and user of an instance cannot be changed, so their backend entities are cached on first access
+    _computer = None
+    _user = None
+
     def __init__(self, backend, computer, user):
         """Construct a new instance.
 
@@ -37,6 +45,8 @@ class SqlaAuthInfo(entities.SqlaModelEntity[DbAuthInfo], BackendAuthInfo):
         type_check(user, users.SqlaUser)
         type_check(computer, computers.SqlaComputer)
         self._dbmodel = utils.ModelWrapper(DbAuthInfo(dbcomputer=computer.dbmodel, aiidauser=user.dbmodel))
+        self._computer = computer
+        self._user = user
 
     @property
     def id(self):  # pylint: disable=invalid-name
@@ -73,7 +83,9 @@ class SqlaAuthInfo(entities.SqlaModelEntity[DbAuthInfo], BackendAuthInfo):
 
         :return: :class:`aiida.orm.implementation.computers.BackendComputer`
         """
-        return self.backend.computers.from_dbmodel(self._dbmodel.dbcomputer)
+        if self._computer is None:
+            self._computer = self.backend.computers.from_dbmodel(self._dbmodel.dbcomputer)
+        return self._computer
 
     @property
     def user(self):
@@ -81,7 +93,9 @@ class SqlaAuthInfo(entities.SqlaModelEntity[DbAuthInfo], BackendAuthInfo):
 
         :return: :class:`aiida.orm.implementation.users.BackendUser`
         """
-        return self._backend.users.from_dbmodel(self._dbmodel.aiidauser)
+        if self._user is None:
+            self._user = self._backend.users.from_dbmodel(self._dbmodel.aiidauser)
+        return self._user
 
     def get_auth_params(self):
         """Return the dictionary of authentication parameters
@@ -111,6 +125,60 @@ class SqlaAuthInfo(entities.SqlaModelEntity[DbAuthInfo], BackendAuthInfo):
         """
         self._dbmodel._metadata = metadata  # pylint: disable=protected-access
 
+    def set_fields(self, enabled=None, auth_params=None, metadata=None):
+        """Set multiple fields of this instance at once, writing them with a single database update.
+
+        :param enabled: optional boolean, True to enable the instance, False to disable it
+        :param auth_params: optional dictionary with authentication parameters
+        :param metadata: optional dictionary with metadata
+        """
+        fields = {'enabled': enabled, 'auth_params': auth_params, '_metadata': metadata}
+        self._dbmodel.set_fields(**{key: value for key, value in fields.items() if value is not None})
+
+    def get_metadata_key(self, key):
+        """Return the value of a single key of the metadata
+
+        For a stored instance, only the value of the key is fetched from the database instead of the entire metadata.
+
+        :param key: the metadata key
+        :return: the value of the key
+        :raises KeyError: if the key does not exist in the metadata
+        """
+        if not self.is_stored:
+            return super().get_metadata_key(key)
+
+        column = DbAuthInfo._metadata  # pylint: disable=protected-access
+        query = get_scoped_session().query(column.has_key(key), column[key]).filter(DbAuthInfo.id == self.id)
+        exists, value = query.one()
+
+        if not exists:
+            raise KeyError(key)
+
+        return value
+
+    def set_metadata_key(self, key, value):
+        """Set the value of a single key of the metadata
+
+        For a stored instance, the key is updated in place in the database instead of writing the entire metadata.
+
+        :param key: the metadata key
+        :param value: the value to set, which should be JSON-serializable
+        """
+        if not self.is_stored:
+            super().set_metadata_key(key, value)
+            return
+
+        session = get_scoped_session()
+        column = DbAuthInfo._metadata  # pylint: disable=protected-access
+        metadata = func.coalesce(column, literal({}, type_=JSONB)).op('||')(literal({key: value}, type_=JSONB))
+
+        session.query(DbAuthInfo).filter(DbAuthInfo.id == self.id).update({column: metadata}, synchronize_session=False)
+        # Make sure the metadata are reloaded from the database when they are next accessed
+        session.expire(self.dbmodel, ['_metadata'])
+
+        if not self._dbmodel._in_transaction():  # pylint: disable=protected-access
+            session.commit()
+
 
 class SqlaAuthInfoCollection(BackendAuthInfoCollection):
     """The collection of SqlAlchemy backend `AuthInfo` entries."""
@@ -155,5 +223,30 @@ class SqlaAuthInfoCollection(BackendAuthInfoCollection):
             raise exceptions.MultipleObjectsError(
                 f'User<{user.email}> has multiple configurations for Computer<{computer.label}>'
             )
-        else:
-            return self.from_dbmodel(authinfo)
+
+        # The computer and user are already known, so set them directly such that they are not loaded again
+        authinfo = self.from_dbmodel(authinfo)
+        authinfo._computer = computer  # pylint: disable=protected-access
+        authinfo._user = user  # pylint: disable=protected-access
+
+        return authinfo
+
+    def get_many(self, pairs):
+        """Return the entries from the collection that are configured for the given computer and user pairs
+
+        :param pairs: iterable of tuples ``(computer_pk, user_pk)``
+        :return: dictionary mapping each pair for which an entry exists onto its
+            :class:`aiida.orm.implementation.authinfos.BackendAuthInfo`
+        """
+        # pylint: disable=import-error,no-name-in-module
+        from sqlalchemy import tuple_
+
+        pairs = list(set(pairs))
+
+        if not pairs:
+            return {}
+
+        session = get_scoped_session()
+        query = session.query(DbAuthInfo).filter(tuple_(DbAuthInfo.dbcomputer_id, DbAuthInfo.aiidauser_id).in_(pairs))
+
+        return {(authinfo.dbcomputer_id, authinfo.aiidauser_id): self.from_dbmodel(authinfo) for authinfo in query}
@@ -9,9 +9,24 @@
 ###########################################################################
 """SqlAlchemy implementation of `aiida.orm.implementation.backends.Backend`."""
 from contextlib import contextmanager
+import functools
+import itertools
+import uuid
 
+# pylint: disable=import-error,no-name-in-module
+from sqlalchemy import text
+from sqlalchemy.exc import ResourceClosedError
+from sqlalchemy.orm.attributes import set_committed_value
+
+from aiida.backends import sqlalchemy as sa
+from aiida.backends.sqlalchemy import get_scoped_session
 from aiida.backends.sqlalchemy.models import base
+from aiida.backends.sqlalchemy.models.computer import DbComputer
+from aiida.backends.sqlalchemy.models.node import DbNode
+from aiida.backends.sqlalchemy.models.user import DbUser
 from aiida.backends.sqlalchemy.manager import SqlaBackendManager
+from aiida.common.lang import cached_property
+from aiida.common.utils import grouper
 
 from ..sql.backends import SqlBackend
 from . import authinfos
@@ -27,53 +42,60 @@ from . import users
 __all__ = ('SqlaBackend',)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_text(query):
+    """Return the textual SQL construct of a raw SQL statement, caching it for repeated executions.
+
+    :param query: a string containing a raw SQL statement
+    :return: the textual SQL construct
+    :rtype: :class:`sqlalchemy.sql.expression.TextClause`
+    """
+    return text(query)
+
+
 class SqlaBackend(SqlBackend[base.Base]):
     """SqlAlchemy implementation of `aiida.orm.implementation.backends.Backend`."""
 
     def __init__(self):
-        """Construct the backend instance by initializing all the collections."""
-        self._authinfos = authinfos.SqlaAuthInfoCollection(self)
-        self._comments = comments.SqlaCommentCollection(self)
-        self._computers = computers.SqlaComputerCollection(self)
-        self._groups = groups.SqlaGroupCollection(self)
-        self._logs = logs.SqlaLogCollection(self)
-        self._nodes = nodes.SqlaNodeCollection(self)
+        """Construct the backend instance.
+
+        The collections are only constructed when they are first accessed.
+        """
         self._schema_manager = SqlaBackendManager()
-        self._users = users.SqlaUserCollection(self)
 
     def migrate(self):
         self._schema_manager.migrate()
 
-    @property
+    @cached_property
     def authinfos(self):
-        return self._authinfos
+        return authinfos.SqlaAuthInfoCollection(self)
 
-    @property
+    @cached_property
     def comments(self):
-        return self._comments
+        return comments.SqlaCommentCollection(self)
 
-    @property
+    @cached_property
     def computers(self):
-        return self._computers
+        return computers.SqlaComputerCollection(self)
 
-    @property
+    @cached_property
     def groups(self):
-        return self._groups
+        return groups.SqlaGroupCollection(self)
 
-    @property
+    @cached_property
     def logs(self):
-        return self._logs
+        return logs.SqlaLogCollection(self)
 
-    @property
+    @cached_property
     def nodes(self):
-        return self._nodes
+        return nodes.SqlaNodeCollection(self)
 
     def query(self):
         return querybuilder.SqlaQueryBuilder(self)
 
-    @property
+    @cached_property
     def users(self):
-        return self._users
+        return users.SqlaUserCollection(self)
 
     @contextmanager
     def transaction(self):
@@ -81,11 +103,17 @@ class SqlaBackend(SqlBackend[base.Base]):
 
         If there is an exception within the context then the changes will be rolled back and the state will be as before
         entering. Transactions can be nested.
+
+        Each level commits exactly once: the savepoint of this level is released or rolled back and, only for the
+        outermost level, the enclosing session transaction is committed. The savepoint is required even for the
+        outermost level, because the `ModelWrapper` relies on it to detect that it is inside a transaction.
         """
         session = self.get_session()
         nested = session.transaction.nested
+        # Begin the savepoint outside of the ``try`` block: if it fails, the rollback would otherwise be applied to the
+        # transaction of the enclosing level instead.
+        session.begin_nested()
         try:
-            session.begin_nested()
             yield session
             session.commit()
         except Exception:
@@ -102,7 +130,6 @@ class SqlaBackend(SqlBackend[base.Base]):
 
         :return: an instance of :class:`sqlalchemy.orm.session.Session`
         """
-        from aiida.backends.sqlalchemy import get_scoped_session
         return get_scoped_session()
 
     # Below are abstract methods inherited from `aiida.orm.implementation.sql.backends.SqlBackend`
@@ -111,30 +138,75 @@ class SqlaBackend(SqlBackend[base.Base]):
         """Return a `BackendEntity` instance from a `DbModel` instance."""
         return convert.get_backend_entity(model, self)
 
+    def get_backend_entities(self, models):
+        """Return the `BackendEntity` instances for a sequence of `DbModel` instances.
+
+        The users and computers of the node models that are not loaded yet are fetched with a single query each, such
+        that accessing them does not emit a query for every node.
+        """
+        dbnodes = [model for model in models if isinstance(model, DbNode)]
+        relationships = (('user', 'user_id', DbUser), ('dbcomputer', 'dbcomputer_id', DbComputer))
+
+        for relationship, column, model_class in relationships:
+            unloaded = [dbnode for dbnode in dbnodes if relationship not in dbnode.__dict__]
+            pks = {getattr(dbnode, column) for dbnode in unloaded} - {None}
+
+            if not pks:
+                continue
+
+            query = self.get_session().query(model_class).filter(model_class.id.in_(pks))
+            related = {entity.id: entity for entity in query}
+
+            for dbnode in unloaded:
+                set_committed_value(dbnode, relationship, related.get(getattr(dbnode, column)))
+
+        return [convert.get_backend_entity(model, self) for model in models]
+
+    def iter_query(self, query, chunk_size=1000):
+        """Iterate over the `BackendEntity` instances of a `Query`, loading its models in batches with `yield_per`."""
+        for models in grouper(chunk_size, query.yield_per(chunk_size)):
+            yield from self.get_backend_entities(models)
+
     @contextmanager
-    def cursor(self):
+    def cursor(self, server_side=False):
         """Return a psycopg cursor to be used in a context manager.
 
+        :param server_side: if True, return a named cursor whose result set is kept on the server.
         :return: a psycopg cursor
         :rtype: :class:`psycopg2.extensions.cursor`
         """
-        from aiida.backends import sqlalchemy as sa
+        connection = self.get_connection()
         try:
-            connection = sa.ENGINE.raw_connection()
-            yield connection.cursor()
+            cursor = connection.cursor(name=f'aiida_{uuid.uuid4().hex}') if server_side else connection.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
         finally:
-            self.get_connection().close()
+            # For a pooled connection this does not close it but returns it to the pool
+            connection.close()
 
-    def execute_raw(self, query):
+    def execute_raw(self, query, stream=False, arraysize=2000, prepare=False):
         """Execute a raw SQL statement and return the result.
 
         :param query: a string containing a raw SQL statement
+        :param stream: if True, return a generator that fetches the rows from a server-side cursor in batches.
+        :param arraysize: the number of rows fetched per round-trip to the database when streaming.
+        :param prepare: if True, execute the statement through a prepared statement cached for the connection.
         :return: the result of the query
         """
-        from sqlalchemy.exc import ResourceClosedError  # pylint: disable=import-error,no-name-in-module
+        if stream:
+            return itertools.chain.from_iterable(self.execute_raw_iter(query, arraysize))
+
+        if prepare:
+            with self.transaction() as session:
+                # Use the connection of the session, such that the statement is part of its transaction
+                with session.connection().connection.cursor() as cursor:
+                    self.execute_prepared_raw(cursor, query)
+                    return cursor.fetchall() if cursor.description is not None else None
 
         with self.transaction() as session:
-            queryset = session.execute(query)
+            queryset = session.execute(_compile_text(query))
 
             try:
                 results = queryset.fetchall()
@@ -143,11 +215,21 @@ class SqlaBackend(SqlBackend[base.Base]):
 
         return results
 
+    def execute_raw_iter(self, query, chunk_size=1000):
+        """Execute a raw SQL statement with a server-side cursor and yield the rows in chunks.
+
+        :param query: a string containing a raw SQL statement that returns rows
+        :param chunk_size: the number of rows fetched per round-trip to the database.
+        :return: a generator of lists of at most ``chunk_size`` rows
+        """
+        with self.transaction() as session:
+            queryset = session.execute(_compile_text(query).execution_options(stream_results=True))
+            yield from iter(lambda: queryset.fetchmany(chunk_size), [])
+
     @staticmethod
     def get_connection():
         """Get the SQLA database connection
 
         :return: the SQLA database connection
         """
-        from aiida.backends import sqlalchemy as sa
         return sa.ENGINE.raw_connection()
@@ -175,8 +175,15 @@ class SqlaCommentCollection(BackendCommentCollection):
         # Apply filter and delete found entities
         builder = QueryBuilder().append(Comment, filters=filters, project='id')
         entities_to_delete = builder.all(flat=True)
-        for entity in entities_to_delete:
-            self.delete(entity)
+        if entities_to_delete:
+            session = get_scoped_session()
+            try:
+                query = session.query(models.DbComment).filter(models.DbComment.id.in_(entities_to_delete))
+                query.delete(synchronize_session=False)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
 
         # Return list of deleted entities' (former) PKs for checking
         return entities_to_delete
@@ -156,8 +156,15 @@ class SqlaLogCollection(BackendLogCollection):
         # Apply filter and delete found entities
         builder = QueryBuilder().append(Log, filters=filters, project='id')
         entities_to_delete = builder.all(flat=True)
-        for entity in entities_to_delete:
-            self.delete(entity)
+        if entities_to_delete:
+            session = get_scoped_session()
+            try:
+                query = session.query(models.DbLog).filter(models.DbLog.id.in_(entities_to_delete))
+                query.delete(synchronize_session=False)
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
 
         # Return list of deleted entities' (former) PKs for checking
         return entities_to_delete
@@ -10,7 +10,7 @@
 # pylint: disable=too-many-lines
 """Sqla query builder implementation"""
 from functools import partial
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 import uuid
 
 from sqlalchemy import and_, or_, not_, func as sa_func
@@ -27,6 +27,8 @@ from sqlalchemy.orm.attributes import InstrumentedAttribute, QueryableAttribute
 from sqlalchemy.types import Integer, Float, Boolean, DateTime, String
 
 from aiida.common.exceptions import NotExistent
+from aiida.common.lang import cached_property
+from aiida.common.utils import grouper
 from aiida.orm.implementation.querybuilder import (BackendQueryBuilder, EntityTypes, QueryDictType, QUERYBUILD_LOGGER)
 from .joiner import SqlaJoiner
 
@@ -117,47 +119,47 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         self.inner_to_outer_schema['db_dbcomputer'] = {'_metadata': 'metadata'}
         self.inner_to_outer_schema['db_dblog'] = {'_metadata': 'metadata'}
 
-    @property
+    @cached_property
     def Node(self):
         import aiida.backends.sqlalchemy.models.node
         return aiida.backends.sqlalchemy.models.node.DbNode
 
-    @property
+    @cached_property
     def Link(self):
         import aiida.backends.sqlalchemy.models.node
         return aiida.backends.sqlalchemy.models.node.DbLink
 
-    @property
+    @cached_property
     def Computer(self):
         import aiida.backends.sqlalchemy.models.computer
         return aiida.backends.sqlalchemy.models.computer.DbComputer
 
-    @property
+    @cached_property
     def User(self):
         import aiida.backends.sqlalchemy.models.user
         return aiida.backends.sqlalchemy.models.user.DbUser
 
-    @property
+    @cached_property
     def Group(self):
         import aiida.backends.sqlalchemy.models.group
         return aiida.backends.sqlalchemy.models.group.DbGroup
 
-    @property
+    @cached_property
     def AuthInfo(self):
         import aiida.backends.sqlalchemy.models.authinfo
         return aiida.backends.sqlalchemy.models.authinfo.DbAuthInfo
 
-    @property
+    @cached_property
     def Comment(self):
         import aiida.backends.sqlalchemy.models.comment
         return aiida.backends.sqlalchemy.models.comment.DbComment
 
-    @property
+    @cached_property
     def Log(self):
         import aiida.backends.sqlalchemy.models.log
         return aiida.backends.sqlalchemy.models.log.DbLog
 
-    @property
+    @cached_property
     def table_groups_nodes(self):
         import aiida.backends.sqlalchemy.models.group
         return aiida.backends.sqlalchemy.models.group.table_groups_nodes
@@ -218,16 +220,16 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                 # if you have provided an ormclass
 
                 if list(tag_to_index_dict.values()) == ['*']:
-                    for rowitem in results:
-                        yield [self.to_backend(rowitem)]
+                    rows = ([rowitem] for rowitem in results)
                 else:
-                    for rowitem, in results:
-                        yield [self.to_backend(rowitem)]
+                    rows = ([rowitem] for rowitem, in results)
             elif len(tag_to_index_dict) > 1:
-                for resultrow in results:
-                    yield [self.to_backend(rowitem) for rowitem in resultrow]
+                rows = (list(resultrow) for resultrow in results)
             else:
                 raise ValueError('Got an empty dictionary')
+
+            for batch in grouper(batch_size or 100, rows):
+                yield from self.to_backend_rows(batch)
         except Exception:
             self.get_session().close()
             raise
@@ -1024,6 +1026,28 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         except TypeError:
             return res
 
+    def to_backend_rows(self, rows: Sequence[List[Any]]) -> List[List[Any]]:
+        """Convert rows of results to return backend specific objects, see :meth:`to_backend`.
+
+        The `DbModel` instances of all the rows are converted with a single call to the backend, which allows it to load
+        their relationships in bulk instead of once per instance.
+
+        :param rows: the rows of results returned by the query
+
+        :returns: list of rows with backend compatible instances
+        """
+        models = [rowitem for row in rows for rowitem in row if hasattr(rowitem, '_sa_instance_state')]
+
+        try:
+            entities = iter(self._backend.get_backend_entities(models))
+        except TypeError:
+            # Not all models have a corresponding backend entity, so fall back to converting them one by one
+            return [[self.to_backend(rowitem) for rowitem in row] for row in rows]
+
+        return [[
+            next(entities) if hasattr(rowitem, '_sa_instance_state') else self.to_backend(rowitem) for rowitem in row
+        ] for row in rows]
+
     @staticmethod
     def _compile_query(query: Query, literal_binds: bool = False) -> SQLCompiler:
         """Compile the query to the SQL executable.
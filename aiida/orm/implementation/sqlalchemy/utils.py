@@ -79,6 +79,21 @@ class ModelWrapper:
             fields = set((key,) + self._auto_flush)
             self._flush(fields=fields)
 
+    def set_fields(self, **fields):
+        """Set multiple attributes on the model instance at once.
+
+        If the model is saved, the changes to all mutable model fields are flushed together, instead of once per field
+        as is the case when setting the attributes one by one.
+
+        :param fields: the names of the model fields with the values to set
+        """
+        for key, value in fields.items():
+            setattr(self._model, key, value)
+
+        fields = {key for key in fields if self._is_mutable_model_field(key)}
+        if self.is_saved() and fields:
+            self._flush(fields=fields.union(self._auto_flush))
+
     def is_saved(self):
         """Retun whether the wrapped model instance is saved in the database.
 
@@ -97,8 +97,7 @@ class Dict(Data):
 
         :param dictionary: a dictionary with the keys to substitute
         """
-        for key, value in dictionary.items():
-            self.set_attribute(key, value)
+        self.set_attribute_many(dictionary)
 
     def get_dict(self):
         """Return a dictionary with the parameters currently set.
@@ -146,8 +146,13 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
         return super().__eq__(other)
 
     def __hash__(self) -> int:
-        """Python-Hash: Implementation that is compatible with __eq__"""
-        return UUID(self.uuid).int
+        """Python-Hash: Implementation that is compatible with __eq__
+
+        Since the UUID of a node is immutable, the hash is computed only once and then cached.
+        """
+        if self._hash is None:
+            self._hash = UUID(self.uuid).int
+        return self._hash
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {str(self)}>'
@@ -177,6 +182,9 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
         # A cache of incoming links represented as a list of LinkTriples instances
         self._incoming_cache = list()
 
+        # A cache of the hash of the node, which is derived from its immutable UUID
+        self._hash: Optional[int] = None
+
     def _validate(self) -> bool:
         """Validate information stored in Node object.
 
@@ -713,11 +721,15 @@ class Node(Entity, NodeRepositoryMixin, EntityAttributesMixin, EntityExtrasMixin
 
         self.repository_metadata = self._repository.serialize()
 
+        # The hash can be computed before storing, since the values have already been cleaned such that they do not
+        # change in a round trip through the database. Setting it before storing saves it with the node itself, instead
+        # of requiring a separate update of its extras once the node is stored.
+        self._backend_entity.set_extra(_HASH_EXTRA_KEY, self._get_hash())
+
         links = self._incoming_cache
         self._backend_entity.store(links, with_transaction=with_transaction, clean=clean)
 
         self._incoming_cache = list()
-        self._backend_entity.set_extra(_HASH_EXTRA_KEY, self.get_hash())
 
         return self
 
@@ -998,7 +998,7 @@ class QueryBuilder:
         """
         return self._impl.count(self.as_dict())
 
-    def iterall(self, batch_size: Optional[int] = 100) -> Iterable[List[Any]]:
+    def iterall(self, batch_size: Optional[int] = 100, flat: bool = False) -> Iterable[Any]:
         """
         Same as :meth:`.all`, but returns a generator.
         Be aware that this is only safe if no commit will take place during this
@@ -1008,15 +1008,19 @@ class QueryBuilder:
         :param batch_size:
             The size of the batches to ask the backend to batch results in subcollections.
             You can optimize the speed of the query by tuning this parameter.
+        :param flat: yield the projected entities of all rows one by one, instead of a list per row.
 
-        :returns: a generator of lists
+        :returns: a generator of lists, or of projected entities if ``flat`` is True
         """
         for item in self._impl.iterall(self.as_dict(), batch_size):
             # Convert to AiiDA frontend entities (if they are such)
             for i, item_entry in enumerate(item):
                 item[i] = self._get_aiida_entity_res(item_entry)
 
-            yield item
+            if flat:
+                yield from item
+            else:
+                yield item
 
     def iterdict(self, batch_size: Optional[int] = 100) -> Iterable[Dict[str, Dict[str, Any]]]:
         """
@@ -1049,12 +1053,7 @@ class QueryBuilder:
         :param flat: return the result as a flat list of projected entities without sub lists.
         :returns: a list of lists of all projected entities.
         """
-        matches = list(self.iterall(batch_size=batch_size))
-
-        if not flat:
-            return matches
-
-        return [projection for entry in matches for projection in entry]
+        return list(self.iterall(batch_size=batch_size, flat=flat))
 
     def one(self) -> List[Any]:
         """Executes the query asking for exactly one results.
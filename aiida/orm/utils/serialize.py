@@ -23,6 +23,13 @@ from plumpy.utils import AttributesFrozendict
 from aiida import orm
 from aiida.common import AttributeDict
 
+# Use the LibYAML based dumper and loader if available, as they are a lot faster than the pure Python implementations.
+# They are otherwise equivalent: the produced yaml and the objects that are constructed from it are the same.
+try:
+    from yaml import CDumper as Dumper, CLoader as Loader
+except ImportError:  # pragma: no cover
+    from yaml import Dumper, Loader  # type: ignore[misc]
+
 _NODE_TAG = '!aiida_node'
 _GROUP_TAG = '!aiida_group'
 _COMPUTER_TAG = '!aiida_computer'
@@ -159,7 +166,7 @@ def bundle_constructor(loader, bundle):
     return bundle
 
 
-class AiiDADumper(yaml.Dumper):
+class AiiDADumper(Dumper):
     """Custom AiiDA yaml dumper.
 
     Needed so that we don't have to encode each type in the AiiDA graph hierarchy separately using a custom representer.
@@ -176,7 +183,7 @@ class AiiDADumper(yaml.Dumper):
         return super().represent_data(data)
 
 
-class AiiDALoader(yaml.Loader):
+class AiiDALoader(Loader):
     """AiiDA specific yaml loader
 
     .. note:: The `AiiDALoader` should only be used on trusted input, since it uses the `yaml.Loader` which is not safe.
@@ -220,8 +220,6 @@ class DirectScheduler(aiida.schedulers.Scheduler):
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
         """
-        import re
-
         filtered_stderr = '\n'.join(l for l in stderr.split('\n'))
         if filtered_stderr.strip():
             self.logger.warning(f"Warning in _parse_joblist_output, non-empty (filtered) stderr='{filtered_stderr}'")
@@ -231,11 +229,11 @@ class DirectScheduler(aiida.schedulers.Scheduler):
         # Create dictionary and parse specific fields
         job_list = []
         for line in stdout.split('\n'):
-            if re.search(r'^\s*PID', line) or line == '':
-                # Skip the header if present
+            # Splitting on whitespace also discards the leading and trailing whitespace of the line
+            job = line.split()
+            if not job or job[0] == 'PID':
+                # Skip empty lines and the header if present
                 continue
-            line = re.sub(r'^\s+', '', line)
-            job = re.split(r'\s+', line)
             this_job = JobInfo()
             this_job.job_id = job[0]
 
@@ -263,7 +261,7 @@ class DirectScheduler(aiida.schedulers.Scheduler):
 
             try:
                 this_job.wallclock_time_seconds = self._convert_time(job[3])
-            except KeyError:
+            except IndexError:
                 # May not have started yet
                 pass
             except ValueError:
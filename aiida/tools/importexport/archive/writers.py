@@ -16,7 +16,7 @@ import shutil
 import time
 import tempfile
 from types import TracebackType
-from typing import Any, cast, Dict, List, Optional, Type, Union
+from typing import Any, cast, Dict, Iterable, List, Optional, Type, Union
 import zipfile
 
 from archive_path import TarPath, ZipPath
@@ -160,6 +160,17 @@ class ArchiveWriterAbstract(ABC):
 
         """
 
+    def write_links(self, links: Iterable[Dict[str, str]]):
+        """Write dictionaries of information for multiple provenance links.
+
+        Writers can override this method to add all links at once, instead of calling ``write_link`` for each link.
+
+        :param links: iterable of dictionaries as accepted by ``write_link``
+
+        """
+        for data in links:
+            self.write_link(data)
+
     @abstractmethod
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
         """Write a mapping of a group to the nodes it contains.
@@ -211,6 +222,9 @@ class WriterNull(ArchiveWriterAbstract):
     def write_link(self, data: Dict[str, str]):
         pass
 
+    def write_links(self, links: Iterable[Dict[str, str]]):
+        pass
+
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
         pass
 
@@ -312,6 +326,9 @@ class WriterJsonZip(ArchiveWriterAbstract):
     def write_link(self, data: Dict[str, str]):
         self._data['links_uuid'].append(data)
 
+    def write_links(self, links: Iterable[Dict[str, str]]):
+        self._data['links_uuid'].extend(links)
+
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
         self._data['groups_uuid'][uuid] = node_uuids
 
@@ -400,6 +417,9 @@ class WriterJsonTar(ArchiveWriterAbstract):
     def write_link(self, data: Dict[str, str]):
         self._data['links_uuid'].append(data)
 
+    def write_links(self, links: Iterable[Dict[str, str]]):
+        self._data['links_uuid'].extend(links)
+
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
         self._data['groups_uuid'][uuid] = node_uuids
 
@@ -487,6 +507,9 @@ class WriterJsonFolder(ArchiveWriterAbstract):
     def write_link(self, data: Dict[str, str]):
         self._data['links_uuid'].append(data)
 
+    def write_links(self, links: Iterable[Dict[str, str]]):
+        self._data['links_uuid'].extend(links)
+
     def write_group_nodes(self, uuid: str, node_uuids: List[str]):
         self._data['groups_uuid'][uuid] = node_uuids
 
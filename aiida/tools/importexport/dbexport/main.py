@@ -30,6 +30,7 @@ from typing import (
 from aiida import get_version, orm
 from aiida.common.links import GraphTraversalRules
 from aiida.common.lang import type_check
+from aiida.common.utils import grouper
 from aiida.common.progress_reporter import get_progress_reporter, create_callback
 from aiida.tools.importexport.common import exceptions
 from aiida.tools.importexport.common.config import (
@@ -41,7 +42,6 @@ from aiida.tools.importexport.common.config import (
     NODE_ENTITY_NAME,
     ExportFileFormat,
     entity_names_to_entities,
-    file_fields_to_model_fields,
     get_all_fields_info,
     model_fields_to_file_fields,
 )
@@ -51,12 +51,24 @@ from aiida.tools.importexport.dbexport.utils import (
     EXPORT_LOGGER,
     check_licenses,
     fill_in_query,
-    serialize_dict,
+    get_model_fields,
+    serialize_field,
     summary,
 )
 
 __all__ = ('export', 'EXPORT_LOGGER', 'ExportFileFormat')
 
+# Select the distinct hashkeys of all objects in the repositories of the given nodes, by recursively walking the nested
+# objects of their repository metadata, where each object has a hashkey `k` if it is a file and objects `o` otherwise.
+SELECT_REPOSITORY_HASHKEYS = """
+    WITH RECURSIVE objects(object) AS (
+        SELECT value FROM db_dbnode, jsonb_each(repository_metadata -> 'o') WHERE id = ANY(%(node_pks)s)
+        UNION ALL
+        SELECT child.value FROM objects, jsonb_each(objects.object -> 'o') AS child
+    )
+    SELECT DISTINCT object ->> 'k' FROM objects WHERE object ? 'k';
+    """
+
 
 def export(
     entities: Optional[Iterable[Any]] = None,
@@ -200,50 +212,51 @@ def export(
 
         # Create a mapping of node PK to UUID.
         node_pk_2_uuid_mapping: Dict[int, str] = {}
-        repository_metadata_mapping: Dict[int, dict] = {}
 
         if node_ids_to_be_exported:
             qbuilder = orm.QueryBuilder().append(
                 orm.Node,
-                project=('id', 'uuid', 'repository_metadata'),
+                project=('id', 'uuid'),
                 filters={'id': {
                     'in': node_ids_to_be_exported
                 }},
             )
-            for pk, uuid, repository_metadata in qbuilder.iterall(batch_size=batch_size):
-                node_pk_2_uuid_mapping[pk] = uuid
-                repository_metadata_mapping[pk] = repository_metadata
+            node_pk_2_uuid_mapping.update(qbuilder.iterall(batch_size=batch_size))
 
         # check that no nodes are being exported with incorrect licensing
-        _check_node_licenses(node_ids_to_be_exported, allowed_licenses, forbidden_licenses)
+        _check_node_licenses(node_ids_to_be_exported, allowed_licenses, forbidden_licenses, batch_size)
 
         # write the link data
         if traverse_output['links'] is not None:
             with get_progress_reporter()(total=len(traverse_output['links']), desc='Writing links') as progress:
-                for link in traverse_output['links']:
-                    progress.update()
-                    writer_context.write_link({
-                        'input': node_pk_2_uuid_mapping[link.source_id],
-                        'output': node_pk_2_uuid_mapping[link.target_id],
+                get_uuid = node_pk_2_uuid_mapping.__getitem__
+                write_links = writer_context.write_links
+                for links in grouper(batch_size, traverse_output['links']):
+                    write_links([{
+                        'input': get_uuid(link.source_id),
+                        'output': get_uuid(link.target_id),
                         'label': link.link_label,
                         'type': link.link_type,
-                    })
+                    } for link in links])
+                    progress.update(len(links))
+
+            # the links are no longer needed, so release them before the entity data is written
+            traverse_output['links'] = None
 
         # generate a list of queries to encapsulate all required entities
-        entity_queries = _collect_entity_queries(
+        entity_queries, entity_counts = _collect_entity_queries(
             node_ids_to_be_exported,
             entities_starting_set,
             node_pk_2_uuid_mapping,
             include_comments,
             include_logs,
+            batch_size,
         )
 
-        total_entities = sum(query.count() for query in entity_queries.values())
-
         # write all entity data fields
-        if total_entities:
+        if entity_queries:
             exported_entity_pks = _write_entity_data(
-                total_entities=total_entities,
+                total_entities=sum(entity_counts.values()),
                 entity_queries=entity_queries,
                 writer=writer_context,
                 batch_size=batch_size
@@ -264,11 +277,7 @@ def export(
         # copy all required node repositories
         if exported_entity_pks[NODE_ENTITY_NAME]:
 
-            _write_node_repositories(
-                node_pks=exported_entity_pks[NODE_ENTITY_NAME],
-                repository_metadata_mapping=repository_metadata_mapping,
-                writer=writer_context
-            )
+            _write_node_repositories(node_pks=exported_entity_pks[NODE_ENTITY_NAME], writer=writer_context)
 
         EXPORT_LOGGER.report('Finalizing Export...')
 
@@ -293,19 +302,17 @@ def _get_starting_node_ids(entities: List[Any]) -> Tuple[DefaultDict[str, Set[st
     entities_starting_set: DefaultDict[str, Set[str]] = defaultdict(set)
     given_node_entry_ids: Set[int] = set()
 
-    # store a list of the actual dbnodes
-    total = len(entities) + (1 if GROUP_ENTITY_NAME in entities_starting_set else 0)
-    if not total:
+    if not entities:
         return entities_starting_set, given_node_entry_ids
 
     for entry in entities:
 
-        if issubclass(entry.__class__, orm.Group):
+        if isinstance(entry, orm.Group):
             entities_starting_set[GROUP_ENTITY_NAME].add(entry.uuid)
-        elif issubclass(entry.__class__, orm.Node):
+        elif isinstance(entry, orm.Node):
             entities_starting_set[NODE_ENTITY_NAME].add(entry.uuid)
             given_node_entry_ids.add(entry.pk)
-        elif issubclass(entry.__class__, orm.Computer):
+        elif isinstance(entry, orm.Computer):
             entities_starting_set[COMPUTER_ENTITY_NAME].add(entry.uuid)
         else:
             raise exceptions.ArchiveExportError(
@@ -333,15 +340,13 @@ def _get_starting_node_ids(entities: List[Any]) -> Tuple[DefaultDict[str, Set[st
 
         if node_count:
             with get_progress_reporter()(desc='Collecting nodes in groups', total=node_count) as progress:
+                rows = node_query.all()
+                progress.update(len(rows))
 
-                pks, uuids = [], []
-                for pk, uuid in node_query.all():
-                    progress.update()
-                    pks.append(pk)
-                    uuids.append(uuid)
-
-            entities_starting_set[NODE_ENTITY_NAME].update(uuids)
-            given_node_entry_ids.update(pks)
+            if rows:
+                pks, uuids = zip(*rows)
+                entities_starting_set[NODE_ENTITY_NAME].update(uuids)
+                given_node_entry_ids.update(pks)
 
     return entities_starting_set, given_node_entry_ids
 
@@ -350,6 +355,7 @@ def _check_node_licenses(
     node_ids_to_be_exported: Set[int],
     allowed_licenses: Optional[Union[list, Callable]],
     forbidden_licenses: Optional[Union[list, Callable]],
+    batch_size: int = 100,
 ) -> None:
     """Check the nodes to be archived for disallowed licences."""
     # TODO (Spyros) To see better! Especially for functional licenses
@@ -364,37 +370,23 @@ def _check_node_licenses(
             }},
         )
         # Skip those nodes where the license is not set (this is the standard behavior with Django)
-        node_licenses = [(a, b) for [a, b] in builder.all() if b is not None]
+        node_licenses = ((a, b) for [a, b] in builder.iterall(batch_size=batch_size) if b is not None)
         check_licenses(node_licenses, allowed_licenses, forbidden_licenses)
 
 
-def _get_model_fields(entity_name: str) -> List[str]:
-    """Return a list of fields to retrieve for a particular entity
-
-    :param entity_name: name of database entity, such as Node
-
-    """
-    all_fields_info, _ = get_all_fields_info()
-    project_cols = ['id']
-    entity_prop = all_fields_info[entity_name].keys()
-    # Here we do the necessary renaming of properties
-    for prop in entity_prop:
-        # nprop contains the list of projections
-        nprop = (
-            file_fields_to_model_fields[entity_name][prop] if prop in file_fields_to_model_fields[entity_name] else prop
-        )
-        project_cols.append(nprop)
-    return project_cols
-
-
 def _collect_entity_queries(
     node_ids_to_be_exported: Set[int],
     entities_starting_set: DefaultDict[str, Set[str]],
     node_pk_2_uuid_mapping: Dict[int, str],
     include_comments: bool = True,
     include_logs: bool = True,
-) -> Dict[str, orm.QueryBuilder]:
-    """Gather partial queries for all entities to export."""
+    batch_size: int = 100,
+) -> Tuple[Dict[str, orm.QueryBuilder], Dict[str, int]]:
+    """Gather partial queries for all entities to export.
+
+    :return: the query for each entity and the number of entities it will return, which is the number of UUIDs that it
+        filters on, such that the entities do not have to be counted with a separate query each
+    """
     # pylint: disable=too-many-locals
     given_log_entry_ids = set()
     given_comment_entry_ids = set()
@@ -413,8 +405,7 @@ def _collect_entity_queries(
                 }},
                 project='uuid',
             )
-            res = set(builder.all(flat=True))
-            given_log_entry_ids.update(res)
+            given_log_entry_ids = set(builder.iterall(batch_size=batch_size, flat=True))
 
             progress.update()
 
@@ -429,8 +420,7 @@ def _collect_entity_queries(
                 }},
                 project='uuid',
             )
-            res = set(builder.all(flat=True))
-            given_comment_entry_ids.update(res)
+            given_comment_entry_ids = set(builder.iterall(batch_size=batch_size, flat=True))
 
             progress.update()
 
@@ -446,13 +436,14 @@ def _collect_entity_queries(
         progress.update()
 
         entities_to_add: Dict[str, orm.QueryBuilder] = {}
+        entity_counts: Dict[str, int] = {}
         if not given_entities:
             progress.update()
-            return entities_to_add
+            return entities_to_add, entity_counts
 
         for given_entity in given_entities:
 
-            project_cols = _get_model_fields(given_entity)
+            project_cols = get_model_fields(given_entity)
 
             # Getting the ids that correspond to the right entity
             entry_uuids_to_add = entities_starting_set.get(given_entity, set())
@@ -464,6 +455,10 @@ def _collect_entity_queries(
             elif given_entity == NODE_ENTITY_NAME:
                 entry_uuids_to_add.update({node_pk_2_uuid_mapping[_] for _ in node_ids_to_be_exported})
 
+            # An entity without any entries to export does not need a query that would return no rows anyway
+            if not entry_uuids_to_add:
+                continue
+
             builder = orm.QueryBuilder()
             builder.append(
                 entity_names_to_entities[given_entity],
@@ -475,10 +470,11 @@ def _collect_entity_queries(
                 outerjoin=True,
             )
             entities_to_add[given_entity] = builder
+            entity_counts[given_entity] = len(entry_uuids_to_add)
 
         progress.update()
 
-    return entities_to_add
+    return entities_to_add, entity_counts
 
 
 def _write_entity_data(
@@ -506,39 +502,65 @@ def _write_entity_data(
                     entity_separator,
                 )
 
-            for query_results in entity_query.iterdict(batch_size=batch_size):
-
-                progress.update()
-
-                for key, value in query_results.items():
-
-                    pk = value['id']
+            # The rows of ``iterall`` contain the projections of all tags of the query in the order of its path. The
+            # properties of the entity of each tag are resolved once per query instead of once per row: the column of
+            # its pk, the column and file field name of each field to serialize, the set of its exported pks and the key
+            # of its unique identifier. Unlike ``iterdict``, this does not construct a nested dictionary for every row,
+            # and the fields are only serialized for entities that were not yet exported.
+            query_dict = entity_query.as_dict(copy=False)
+            tag_properties: List[Tuple[str, int, List[Tuple[int, str]], Set[int], str]] = []
+            column = 0
+            for vertex in query_dict['path']:
+                projections = query_dict['project'].get(vertex['tag'], [])
+                projected = [field for projection in projections for field in projection]
+                if projected:
+                    name = vertex['tag'].split(entity_separator)[-1]
+                    rename_fields = model_fields_to_file_fields[name]
+                    tag_properties.append((
+                        name,
+                        column + projected.index('id'),
+                        [(column + offset, rename_fields.get(field, field))
+                         for offset, field in enumerate(projected)
+                         if field != 'id'],
+                        exported_entity_pks[name],
+                        unique_identifiers[name],
+                    ))
+                    column += len(projected)
+
+            # The progress is updated once per batch of rows, since updating the progress bar for each row is costly
+            index = 0
+            for index, row in enumerate(entity_query.iterall(batch_size=batch_size), start=1):
+
+                if index % batch_size == 0:
+                    progress.update(batch_size)
+
+                for current_entity, pk_column, serialized_columns, entity_pks, id_key in tag_properties:
+
+                    pk = row[pk_column]
 
                     # This is an empty result of an outer join.
                     # It should not be taken into account.
                     if pk is None:
                         continue
 
-                    # Get current entity
-                    current_entity = key.split(entity_separator)[-1]
-
-                    # don't allow duplication
-                    if pk in exported_entity_pks[current_entity]:
+                    # Don't allow duplication. The joins added by ``fill_in_query`` are all many-to-one, so the rows of a
+                    # query are already unique and a ``DISTINCT`` in SQL would not remove anything. Duplicates stem from
+                    # the joined entities, e.g. the same user for many nodes, and from entities that were already
+                    # written by a previous query, so they can only be filtered here.
+                    if pk in entity_pks:
                         continue
 
-                    exported_entity_pks[current_entity].add(pk)
+                    entity_pks.add(pk)
 
-                    fields = serialize_dict(
-                        value,
-                        remove_fields=['id'],
-                        rename_fields=model_fields_to_file_fields[current_entity],
-                    )
+                    fields = {field: serialize_field(row[position]) for position, field in serialized_columns}
 
                     if current_entity == NODE_ENTITY_NAME and fields['node_type'].startswith('process.'):
                         if fields['attributes'].get('sealed', False) is not True:
                             unsealed_node_pks.add(pk)
 
-                    writer.write_entity_data(current_entity, pk, unique_identifiers[current_entity], fields)
+                    writer.write_entity_data(current_entity, pk, id_key, fields)
+
+            progress.update(index % batch_size)
 
     if unsealed_node_pks:
         raise exceptions.ExportValidationError(
@@ -560,19 +582,25 @@ def _write_group_mappings(*, group_pks: Set[int], batch_size: int, writer: Archi
         },
         project='uuid',
         tag='groups',
-    ).append(orm.Node, project='uuid', with_group='groups')
+    ).append(orm.Node, project='uuid', with_group='groups').order_by({'groups': 'uuid'})
+
+    # The rows are ordered by group, so the nodes of each group can be written as soon as the next group is reached,
+    # instead of first collecting the nodes of all groups. A node can only be contained once in a group.
+    current_group_uuid = None
+    node_uuids: List[str] = []
 
-    groups_uuid_to_node_uuids = defaultdict(set)
     for group_uuid, node_uuid in group_uuid_query.iterall(batch_size=batch_size):
-        groups_uuid_to_node_uuids[group_uuid].add(node_uuid)
+        if group_uuid != current_group_uuid:
+            if current_group_uuid is not None:
+                writer.write_group_nodes(current_group_uuid, node_uuids)
+            current_group_uuid, node_uuids = group_uuid, []
+        node_uuids.append(node_uuid)
 
-    for group_uuid, node_uuids in groups_uuid_to_node_uuids.items():
-        writer.write_group_nodes(group_uuid, list(node_uuids))
+    if current_group_uuid is not None:
+        writer.write_group_nodes(current_group_uuid, node_uuids)
 
 
-def _write_node_repositories(
-    *, node_pks: Set[int], repository_metadata_mapping: Dict[int, dict], writer: ArchiveWriterAbstract
-):
+def _write_node_repositories(*, node_pks: Set[int], writer: ArchiveWriterAbstract):
     """Write all exported node repositories to the archive file."""
     with get_progress_reporter()(total=len(node_pks), desc='Exporting node repositories: ') as progress:
 
@@ -584,30 +612,22 @@ def _write_node_repositories(
             container_export = Container(dirpath)
             container_export.init_container()
 
-            profile = get_manager().get_profile()
-            assert profile is not None, 'profile not loaded'
-            container_profile = profile.get_repository().backend.container
-
-            # This should be done more effectively, starting by not having to load the node. Either the repository
-            # metadata should be collected earlier when the nodes themselves are already exported or a single separate
-            # query should be done.
-            hashkeys = []
-
-            def collect_hashkeys(objects):
-                for obj in objects.values():
-                    hashkey = obj.get('k', None)
-                    if hashkey is not None:
-                        hashkeys.append(hashkey)
-                    subobjects = obj.get('o', None)
-                    if subobjects:
-                        collect_hashkeys(subobjects)
-
-            for pk in node_pks:
-                progress.set_description_str(f'Exporting node repositories: {pk}', refresh=False)
-                progress.update()
-                repository_metadata = repository_metadata_mapping[pk]
-                collect_hashkeys(repository_metadata.get('o', {}))
-
-            callback = create_callback(progress)
-            container_profile.export(set(hashkeys), container_export, compress=False, callback=callback)
+            backend = get_manager().get_backend()
+            rows = backend.execute_prepared_statement(SELECT_REPOSITORY_HASHKEYS, {'node_pks': list(node_pks)})
+            hashkeys = {row[0] for row in rows}
+            progress.update(len(node_pks))
+
+            # Nodes without any files do not require the profile container to be opened at all
+            if hashkeys:
+                profile = get_manager().get_profile()
+                assert profile is not None, 'profile not loaded'
+                container_profile = profile.get_repository().backend.container
+
+                # The export container is a temporary one that is written to the archive right after, so there is no
+                # need to fsync every pack file that is written to it
+                callback = create_callback(progress)
+                container_export.import_objects(
+                    hashkeys, container_profile, compress=False, callback=callback, do_fsync=False
+                )
+
             writer.write_repository_container(container_export)
@@ -9,6 +9,12 @@
 ###########################################################################
 """ Utility functions for export of AiiDA entities """
 # pylint: disable=too-many-locals,too-many-branches,too-many-nested-blocks
+import datetime
+import functools
+from uuid import UUID
+
+import pytz
+
 from aiida.orm import QueryBuilder, ProcessNode
 from aiida.common.log import AIIDA_LOGGER, LOG_LEVEL_REPORT
 
@@ -20,6 +26,20 @@ from aiida.tools.importexport.common.config import (
 EXPORT_LOGGER = AIIDA_LOGGER.getChild('export')
 
 
+@functools.lru_cache(maxsize=None)
+def get_model_fields(entity_name):
+    """Return the model fields to project for a particular entity.
+
+    The fields only depend on the static export schema, so they are computed once per entity.
+
+    :param entity_name: name of database entity, such as Node
+    :return: tuple of the model field names, starting with ``id``
+    """
+    all_fields_info, _ = get_all_fields_info()
+    renamed_fields = file_fields_to_model_fields.get(entity_name, {})
+    return ('id',) + tuple(renamed_fields.get(prop, prop) for prop in all_fields_info[entity_name])
+
+
 def fill_in_query(partial_query, originating_entity_str, current_entity_str, tag_suffixes=None, entity_separator='_'):
     """
     This function recursively constructs QueryBuilder queries that are needed
@@ -63,16 +83,7 @@ def fill_in_query(partial_query, originating_entity_str, current_entity_str, tag
 
     all_fields_info, _ = get_all_fields_info()
 
-    entity_prop = all_fields_info[current_entity_str].keys()
-
-    project_cols = ['id']
-    for prop in entity_prop:
-        nprop = prop
-        if current_entity_str in file_fields_to_model_fields:
-            if prop in file_fields_to_model_fields[current_entity_str]:
-                nprop = file_fields_to_model_fields[current_entity_str][prop]
-
-        project_cols.append(nprop)
+    project_cols = get_model_fields(current_entity_str)
 
     # Here we should reference the entity of the main query
     current_entity_mod = entity_names_to_entities[current_entity_str]
@@ -147,10 +158,6 @@ def serialize_field(data, track_conversion=False):
     :todo: Generalize such that it the proper function is selected also during
         import
     """
-    import datetime
-    import pytz
-    from uuid import UUID
-
     if isinstance(data, dict):
         ret_data = {}
         if track_conversion:
@@ -20,7 +20,10 @@ def run_cli_command():
 
     The call will raise if the command triggered an exception or the exit code returned is non-zero.
     """
-    from click.testing import Result
+    from click.testing import CliRunner, Result
+
+    # The runner isolates each invocation by itself, so a single instance can be shared by all calls of the test
+    runner = CliRunner()
 
     def _run_cli_command(command: click.Command, options: list = None, raises: bool = False) -> Result:
         """Run the command and check the result.
@@ -50,7 +53,6 @@ def run_cli_command():
         # which circumvents this machinery.
         command = VerdiCommandGroup.add_verbosity_option(command)
 
-        runner = click.testing.CliRunner()
         result = runner.invoke(command, options, obj=obj)
 
         if raises:
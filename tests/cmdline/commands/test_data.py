@@ -562,6 +562,23 @@ class TestVerdiDataTrajectory(AiidaTestCase, DummyVerdiDataListable, DummyVerdiD
     def test_list(self):
         self.data_listing_test(TrajectoryData, str(self.ids[DummyVerdiDataListable.NODE_ID_STR]), self.ids)
 
+    def test_list_redirected(self):
+        """Test the listing when redirected, which is only written as tab-separated values with `--raw`."""
+        node_id = str(self.ids[DummyVerdiDataListable.NODE_ID_STR])
+
+        # The output of the ``CliRunner`` is not a terminal, so it is considered to be redirected
+        res = self.cli_runner.invoke(cmd_trajectory.trajectory_list, [], catch_exceptions=False)
+        lines = res.stdout_bytes.decode('utf-8').splitlines()
+        self.assertEqual(lines[0].split(), cmd_trajectory.LIST_PROJECT_HEADERS)
+        self.assertNotIn('\t', res.output)
+        self.assertIn('Total results:', res.output)
+
+        res = self.cli_runner.invoke(cmd_trajectory.trajectory_list, ['--raw'], catch_exceptions=False)
+        rows = [line.split('\t') for line in res.stdout_bytes.decode('utf-8').splitlines()]
+        self.assertIn(node_id, [row[0] for row in rows])
+        for row in rows:
+            self.assertEqual(len(row), len(cmd_trajectory.LIST_PROJECT_HEADERS))
+
     @unittest.skipUnless(has_pycifrw(), 'Unable to import PyCifRW')
     def test_export(self):
         new_supported_formats = list(cmd_trajectory.EXPORT_FORMATS)
@@ -7,168 +7,132 @@
 # For further information on the license, see the LICENSE.txt file        #
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
-# pylint: disable=invalid-name,protected-access
+# pylint: disable=invalid-name,protected-access,redefined-outer-name
 """Tests for `verdi database`."""
 import enum
 
-from click.testing import CliRunner
 import pytest
 
-from aiida.backends.testbase import AiidaTestCase
+from aiida.backends.utils import delete_nodes_and_connections
 from aiida.cmdline.commands import cmd_database
 from aiida.common.links import LinkType
-from aiida.orm import Data, CalculationNode, WorkflowNode
+from aiida.orm import Data, CalculationNode, Node, QueryBuilder, WorkflowNode
 
 
-class TestVerdiDatabasaIntegrity(AiidaTestCase):
-    """Tests for `verdi database integrity`."""
+class WrongLinkType(enum.Enum):
 
-    @classmethod
-    def setUpClass(cls, *args, **kwargs):
-        """Create a basic valid graph that should help detect false positives."""
-        super().setUpClass(*args, **kwargs)
-        data_input = Data().store()
-        data_output = Data().store()
-        calculation = CalculationNode()
-        workflow_parent = WorkflowNode()
-        workflow_child = WorkflowNode()
-
-        workflow_parent.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_WORK)
-        workflow_parent.store()
+    WRONG_CREATE = 'wrong_create'
 
-        workflow_child.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_WORK)
-        workflow_child.add_incoming(workflow_parent, link_label='call', link_type=LinkType.CALL_WORK)
-        workflow_child.store()
 
-        calculation.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_CALC)
-        calculation.add_incoming(workflow_child, link_label='input', link_type=LinkType.CALL_CALC)
-        calculation.store()
+@pytest.fixture(scope='module')
+def valid_graph(aiida_profile):
+    """Create a basic valid graph that should help detect false positives and return the pks of its nodes."""
+    aiida_profile.reset_db()
 
-        data_output.add_incoming(calculation, link_label='output', link_type=LinkType.CREATE)
-        data_output.add_incoming(workflow_child, link_label='output', link_type=LinkType.RETURN)
-        data_output.add_incoming(workflow_parent, link_label='output', link_type=LinkType.RETURN)
+    data_input = Data().store()
+    data_output = Data().store()
+    calculation = CalculationNode()
+    workflow_parent = WorkflowNode()
+    workflow_child = WorkflowNode()
 
-    def setUp(self):
-        self.refurbish_db()
-        self.cli_runner = CliRunner()
+    workflow_parent.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_WORK)
+    workflow_parent.store()
 
-    def test_detect_invalid_links_workflow_create(self):
-        """Test `verdi database integrity detect-invalid-links` outgoing `create` from `workflow`."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
+    workflow_child.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_WORK)
+    workflow_child.add_incoming(workflow_parent, link_label='call', link_type=LinkType.CALL_WORK)
+    workflow_child.store()
 
-        # Create an invalid link: outgoing `create` from a workflow
-        data = Data().store().backend_entity
-        workflow = WorkflowNode().store().backend_entity
+    calculation.add_incoming(data_input, link_label='input', link_type=LinkType.INPUT_CALC)
+    calculation.add_incoming(workflow_child, link_label='input', link_type=LinkType.CALL_CALC)
+    calculation.store()
 
-        data.add_incoming(workflow, link_type=LinkType.CREATE, link_label='create')
+    data_output.add_incoming(calculation, link_label='output', link_type=LinkType.CREATE)
+    data_output.add_incoming(workflow_child, link_label='output', link_type=LinkType.RETURN)
+    data_output.add_incoming(workflow_parent, link_label='output', link_type=LinkType.RETURN)
 
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
+    yield [node.pk for node in (data_input, data_output, calculation, workflow_parent, workflow_child)]
 
-    def test_detect_invalid_links_calculation_return(self):
-        """Test `verdi database integrity detect-invalid-links` outgoing `return` from `calculation`."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
-
-        # Create an invalid link: outgoing `return` from a calculation
-        data = Data().store().backend_entity
-        calculation = CalculationNode().store().backend_entity
-
-        data.add_incoming(calculation, link_type=LinkType.RETURN, link_label='return')
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
-
-    def test_detect_invalid_links_calculation_call(self):
-        """Test `verdi database integrity detect-invalid-links` outgoing `call` from `calculation`."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
-
-        # Create an invalid link: outgoing `call` from a calculation
-        worklow = WorkflowNode().store().backend_entity
-        calculation = CalculationNode().store().backend_entity
-
-        worklow.add_incoming(calculation, link_type=LinkType.CALL_WORK, link_label='call')
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
-
-    def test_detect_invalid_links_create_links(self):
-        """Test `verdi database integrity detect-invalid-links` when there are multiple incoming `create` links."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
-
-        # Create an invalid link: two `create` links
-        data = Data().store().backend_entity
-        calculation = CalculationNode().store().backend_entity
-
-        data.add_incoming(calculation, link_type=LinkType.CREATE, link_label='create')
-        data.add_incoming(calculation, link_type=LinkType.CREATE, link_label='create')
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
-
-    def test_detect_invalid_links_call_links(self):
-        """Test `verdi database integrity detect-invalid-links` when there are multiple incoming `call` links."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
-
-        # Create an invalid link: two `call` links
-        workflow = WorkflowNode().store().backend_entity
-        calculation = CalculationNode().store().backend_entity
-
-        calculation.add_incoming(workflow, link_type=LinkType.CALL_CALC, link_label='call')
-        calculation.add_incoming(workflow, link_type=LinkType.CALL_CALC, link_label='call')
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
-
-    def test_detect_invalid_links_unknown_link_type(self):
-        """Test `verdi database integrity detect-invalid-links` when link type is invalid."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
+    aiida_profile.reset_db()
 
-        class WrongLinkType(enum.Enum):
-
-            WRONG_CREATE = 'wrong_create'
 
-        # Create an invalid link: invalid link type
-        data = Data().store().backend_entity
-        calculation = CalculationNode().store().backend_entity
+@pytest.fixture
+def integrity_graph(valid_graph):
+    """Provide the valid graph and delete the nodes that the test added to it afterwards."""
+    yield valid_graph
 
-        data.add_incoming(calculation, link_type=WrongLinkType.WRONG_CREATE, link_label='create')
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_links, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
-
-    def test_detect_invalid_nodes_unknown_node_type(self):
-        """Test `verdi database integrity detect-invalid-nodes` when node type is invalid."""
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_nodes, [])
-        self.assertEqual(result.exit_code, 0)
-        self.assertClickResultNoException(result)
+    builder = QueryBuilder().append(Node, filters={'id': {'!in': valid_graph}}, project='id')
+    delete_nodes_and_connections([pk for pk, in builder.iterall()])
 
-        # Create a node with invalid type: since there are a lot of validation rules that prevent us from creating an
-        # invalid node type normally, we have to do it manually on the database model instance before storing
-        node = Data()
-        node.backend_entity.dbmodel.node_type = '__main__.SubClass.'
-        node.store()
-
-        result = self.cli_runner.invoke(cmd_database.detect_invalid_nodes, [])
-        self.assertNotEqual(result.exit_code, 0)
-        self.assertIsNotNone(result.exception)
+
+@pytest.mark.usefixtures('integrity_graph')
+def test_detect_valid_graph(run_cli_command):
+    """Test `verdi database integrity` does not report any violations for the valid graph.
+
+    The other tests only add invalid entities to this graph, so this check does not have to be repeated in each.
+    """
+    run_cli_command(cmd_database.detect_invalid_links)
+    run_cli_command(cmd_database.detect_invalid_nodes)
+
+
+@pytest.mark.usefixtures('integrity_graph')
+@pytest.mark.parametrize(
+    'source_class, target_class, link_type, link_label, number_of_links', (
+        (WorkflowNode, Data, LinkType.CREATE, 'create', 1),
+        (CalculationNode, Data, LinkType.RETURN, 'return', 1),
+        (CalculationNode, WorkflowNode, LinkType.CALL_WORK, 'call', 1),
+        (CalculationNode, Data, LinkType.CREATE, 'create', 2),
+        (WorkflowNode, CalculationNode, LinkType.CALL_CALC, 'call', 2),
+        (CalculationNode, Data, WrongLinkType.WRONG_CREATE, 'create', 1),
+    ),
+    ids=(
+        'workflow-create',
+        'calculation-return',
+        'calculation-call',
+        'multiple-create',
+        'multiple-call',
+        'unknown-link-type',
+    )
+)
+def test_detect_invalid_links(run_cli_command, source_class, target_class, link_type, link_label, number_of_links):
+    """Test `verdi database integrity detect-invalid-links` for the various types of invalid links.
+
+    The invalid links are added through the backend entities, since the front-end ORM would refuse to create them.
+    """
+    source = source_class().store().backend_entity
+    target = target_class().store().backend_entity
+
+    for _ in range(number_of_links):
+        target.add_incoming(source, link_type=link_type, link_label=link_label)
+
+    run_cli_command(cmd_database.detect_invalid_links, raises=True)
+
+
+@pytest.mark.usefixtures('integrity_graph')
+def test_detect_invalid_nodes_unknown_node_type(run_cli_command):
+    """Test `verdi database integrity detect-invalid-nodes` when node type is invalid."""
+    # Create a node with invalid type: since there are a lot of validation rules that prevent us from creating an
+    # invalid node type normally, we have to do it manually on the database model instance before storing
+    node = Data()
+    node.backend_entity.dbmodel.node_type = '__main__.SubClass.'
+    node.store()
+
+    run_cli_command(cmd_database.detect_invalid_nodes, raises=True)
+
+
+@pytest.mark.usefixtures('integrity_graph')
+def test_detect_invalid_nodes_redirected(run_cli_command):
+    """Test `verdi database integrity detect-invalid-nodes` renders the same table when the output is redirected."""
+    node = Data()
+    node.backend_entity.dbmodel.node_type = '__main__.SubClass.'
+    node.store()
+
+    # The output of the ``CliRunner`` is not a terminal, so it is considered to be redirected
+    result = run_cli_command(cmd_database.detect_invalid_nodes, raises=True)
+
+    assert 'detected nodes with invalid type' in result.output
+    assert '\t' not in result.output
+    assert ['ID', 'UUID', 'Type'] in [line.split() for line in result.output_lines]
+    assert [str(node.pk), node.uuid, '__main__.SubClass.'] in [line.split() for line in result.output_lines]
 
 
 @pytest.mark.usefixtures('aiida_profile')
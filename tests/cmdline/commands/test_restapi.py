@@ -15,14 +15,21 @@ from aiida.restapi import run_api
 def test_run_restapi(run_cli_command, monkeypatch):
     """Test ``verdi restapi``."""
 
-    def run_api_noop(*_, **__):
-        pass
+    called_with = {}
+
+    def run_api_noop(*_, **kwargs):
+        called_with.update(kwargs)
 
     monkeypatch.setattr(run_api, 'run_api', run_api_noop)
 
     options = ['--hostname', 'localhost', '--port', '6000', '--debug', '--wsgi-profile']
     run_cli_command(restapi, options)
 
+    assert called_with['hostname'] == 'localhost'
+    assert called_with['port'] == 6000
+    assert called_with['debug'] is True
+    assert called_with['wsgi_profile'] is True
+
 
 def test_help(run_cli_command):
     """Tests help text for restapi command."""
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.cmdline.utils.echo` module."""
+import pytest
+
+from aiida.cmdline.utils import echo
+
+
+@pytest.fixture
+def echo_messages(monkeypatch):
+    """Capture the messages passed to ``echo.echo``."""
+    messages = []
+    monkeypatch.setattr(echo, 'echo', lambda message, **kwargs: messages.append(message))
+    return messages
+
+
+def test_echo_tsv(echo_messages):
+    """Test ``echo_tsv`` replaces ``None`` and line breaks."""
+    echo.echo_tsv([['a', None, 'multi\nline'], [1, 2, 3]])
+    assert echo_messages == ['a\t\tmulti line\n1\t2\t3']
+
+
+@pytest.mark.parametrize('redirected', (True, False))
+def test_echo_table(echo_messages, monkeypatch, redirected):
+    """Test ``echo_table`` renders the same table whether or not the output is redirected."""
+    monkeypatch.setattr(echo, 'is_stdout_redirected', lambda: redirected)
+    echo.echo_table(['name', 'value'], (row for row in [['a', 1], ['b', 2]]))
+
+    assert len(echo_messages) == 1
+    assert echo_messages[0].splitlines() == ['name      value', '------  -------', 'a             1', 'b             2']
@@ -134,8 +134,29 @@ class TestSerialize(AiidaTestCase):
 
         serialized = serialize.serialize(data)
         deserialized = serialize.deserialize_unsafe(serialized)
+        assert isinstance(deserialized, np.ndarray)
         assert np.all(data == deserialized)
 
+        # Arrays are serialized through their reduced state, which contains the raw data buffer as a binary scalar,
+        # rather than as a sequence with an entry per element, so the round trip is bit-exact
+        data = np.random.rand(1000)
+
+        serialized = serialize.serialize(data)
+        deserialized = serialize.deserialize_unsafe(serialized)
+        assert deserialized.dtype == data.dtype
+        assert deserialized.tobytes() == data.tobytes()
+        assert '!!binary' in serialized
+
+    def test_libyaml(self):
+        """Test that the LibYAML based dumper and loader are used if PyYAML was built with it."""
+        import yaml
+
+        if not yaml.__with_libyaml__:
+            self.skipTest('PyYAML was built without LibYAML')
+
+        assert issubclass(serialize.AiiDADumper, yaml.CDumper)
+        assert issubclass(serialize.AiiDALoader, yaml.CLoader)
+
     def test_serialize_simplenamespace(self):  # pylint: disable=no-self-use
         """Regression test for #3709
 
@@ -21,6 +21,7 @@ from aiida.common.lang import override
 from aiida.engine import ExitCode, ExitCodesNamespace, Process, run, run_get_pk, run_get_node
 from aiida.engine.processes.ports import PortNamespace
 from aiida.manage.caching import enable_caching
+from aiida.manage.manager import reset_manager
 from aiida.plugins import CalculationFactory
 
 from tests.utils import processes as test_processes
@@ -99,12 +100,14 @@ class ProcessStackTest(Process):
 class TestProcess(AiidaTestCase):
     """Test AiiDA process."""
 
-    def setUp(self):
-        super().setUp()
-        self.assertIsNone(Process.current())
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        reset_manager()
 
     def tearDown(self):
-        super().tearDown()
+        # The manager is deliberately not reset after each test, such that the runner and its event loop are created
+        # only once and shared by all tests of this class. It is reset once all tests have run in ``tearDownClass``.
         self.assertIsNone(Process.current())
 
     @staticmethod
@@ -124,17 +127,18 @@ class TestProcess(AiidaTestCase):
         """Test input link creation."""
         dummy_inputs = ['a', 'b', 'c', 'd']
 
+        # Only the link creation is tested, so provenance is not stored to avoid storing the nodes in the database
         inputs = {string: orm.Str(string) for string in dummy_inputs}
-        inputs['metadata'] = {'store_provenance': True}
+        inputs['metadata'] = {'store_provenance': False}
         process = test_processes.DummyProcess(inputs)
 
-        for entry in process.node.get_incoming().all():
-            self.assertTrue(entry.link_label in inputs)
+        incoming = process.node.get_incoming().all()
+
+        for entry in incoming:
             self.assertEqual(entry.link_label, entry.node.value)
-            dummy_inputs.remove(entry.link_label)
 
-        # Make sure there are no other inputs
-        self.assertFalse(dummy_inputs)
+        # Make sure that each input is linked exactly once and that there are no other inputs
+        self.assertCountEqual([entry.link_label for entry in incoming], dummy_inputs)
 
     @staticmethod
     def test_none_input():
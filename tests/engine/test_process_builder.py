@@ -15,6 +15,7 @@ from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import LinkType
 from aiida.engine import WorkChain, Process, ProcessBuilderNamespace
+from aiida.engine.processes.ports import InputPort, PortNamespace
 from aiida.plugins import CalculationFactory
 
 DEFAULT_INT = 256
@@ -198,6 +199,27 @@ class TestProcessBuilder(AiidaTestCase):
         self.assertEqual(builder.__class__.name_spaced.__doc__, str(ExampleWorkChain.spec().inputs['name_spaced']))
         self.assertEqual(builder.__class__.boolean.__doc__, str(ExampleWorkChain.spec().inputs['boolean']))
 
+    def test_dynamic_class_reused(self):
+        """Verify that builders for the same process share the class with the dynamic properties."""
+        builder_one = ExampleWorkChain.get_builder()
+        builder_two = ExampleWorkChain.get_builder()
+        self.assertIs(builder_one.__class__, builder_two.__class__)
+        self.assertIs(builder_one.name.__class__, builder_two.name.__class__)
+
+        builder_one.boolean = orm.Bool(True)
+        self.assertIsNone(builder_two.boolean)
+
+    def test_dynamic_class_port_added(self):
+        """Verify that a builder created after a port was added to the namespace has a property for that port."""
+        namespace = PortNamespace('namespace')
+        namespace['first'] = InputPort('first', valid_type=orm.Int)
+        self.assertFalse(hasattr(ProcessBuilderNamespace(namespace).__class__, 'second'))
+
+        namespace['second'] = InputPort('second', valid_type=orm.Int, default=orm.Int(1))
+        builder = ProcessBuilderNamespace(namespace)
+        self.assertEqual(builder.__class__.second.__doc__, str(namespace['second']))
+        self.assertIn('second', dir(builder))
+
     def test_builder_restart_work_chain(self):
         """Verify that nested namespaces imploded into flat link labels can be reconstructed into nested namespaces."""
         caller = orm.WorkChainNode().store()
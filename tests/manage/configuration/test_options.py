@@ -43,6 +43,15 @@ class TestConfigurationOptions(AiidaTestCase):
         with self.assertRaises(ConfigValidationError):
             parse_option('logging.aiida_loglevel', 'INVALID_LOG_LEVEL')
 
+    def test_option_validator(self):
+        """Test that the validator of an option is created once and reused for each validation."""
+        option = get_option('logging.aiida_loglevel')
+        self.assertIs(option.validator, option.validator)
+        self.assertEqual(option.validate('WARNING'), 'WARNING')
+
+        with self.assertRaises(ConfigValidationError):
+            option.validate('INVALID_LOG_LEVEL')
+
     def test_options(self):
         """Test that all defined options can be converted into Option namedtuples."""
         for option_name in get_option_names():
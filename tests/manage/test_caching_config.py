@@ -19,7 +19,7 @@ import yaml
 import pytest
 
 from aiida.common import exceptions
-from aiida.manage.caching import get_use_cache, enable_caching, disable_caching
+from aiida.manage.caching import get_use_cache, get_cache_matcher, enable_caching, disable_caching
 
 
 @pytest.fixture
@@ -195,6 +195,27 @@ def test_configuration(configure_caching, config_dict, enabled_for, disabled_for
             assert not get_use_cache(identifier=identifier)
 
 
+@pytest.mark.parametrize(['config_dict', 'identifiers'], [
+    ({
+        'default_enabled': True,
+        'enabled_for': ['aiida.calculations:arithmetic.add'],
+        'disabled_for': ['aiida.calculations:core.templatereplacer']
+    }, ['some_identifier', 'aiida.calculations:arithmetic.add', 'aiida.calculations:core.templatereplacer']),
+    ({
+        'default_enabled': False,
+        'enabled_for': ['aiida.calculations:*'],
+        'disabled_for': ['aiida.calculations:arithmetic.add']
+    }, ['some_identifier', 'aiida.calculations:arithmetic.add', 'aiida.calculations:core.templatereplacer']),
+])
+def test_cache_matcher(configure_caching, config_dict, identifiers):
+    """Check that the callable returned by `get_cache_matcher` agrees with `get_use_cache`."""
+    with configure_caching(config_dict=config_dict):
+        use_cache = get_cache_matcher()
+        assert use_cache() is get_use_cache()
+        for identifier in identifiers:
+            assert use_cache(identifier) is get_use_cache(identifier=identifier)
+
+
 @pytest.mark.parametrize(
     ['config_dict', 'valid_identifiers', 'invalid_identifiers'],
     [({
@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Unit tests for the ORM Backend class."""
+import pytest
+
 from aiida.backends.testbase import AiidaTestCase
 from aiida import orm
 from aiida.common import exceptions
@@ -16,6 +18,13 @@ from aiida.common import exceptions
 class TestBackend(AiidaTestCase):
     """Test backend."""
 
+    def test_collections(self):
+        """Test that the collections are constructed once and then returned as is."""
+        for name in ('authinfos', 'comments', 'computers', 'groups', 'logs', 'nodes', 'users'):
+            collection = getattr(self.backend, name)
+            self.assertIs(collection.backend, self.backend)
+            self.assertIs(getattr(self.backend, name), collection)
+
     def test_transaction_nesting(self):
         """Test that transaction nesting works."""
         user = orm.User('initial@email.com').store()
@@ -64,3 +73,65 @@ class TestBackend(AiidaTestCase):
 
         with self.assertRaises(exceptions.NotExistent):
             orm.User.objects.get(email='user_store_fail@email.com')
+
+    def test_execute_prepared_statements(self):
+        """Test that multiple prepared statements are executed and return their results in order."""
+        statements = [
+            ('SELECT %(value)s;', dict(value=1)),
+            ('SELECT id FROM db_dbuser WHERE id < %(value)s;', dict(value=0)),
+        ]
+        results = self.backend.execute_prepared_statements(statements)
+        self.assertEqual(results, [[(1,)], []])
+        self.assertEqual(self.backend.execute_prepared_statement(*statements[0]), [(1,)])
+
+    def test_get_backend_entities(self):
+        """Test that a sequence of models is converted into the corresponding backend entities in order."""
+        nodes = [orm.Data().store() for _ in range(3)]
+        models = [node.backend_entity.dbmodel for node in nodes] + [self.computer.backend_entity.dbmodel]
+        entities = self.backend.get_backend_entities(models)
+        self.assertEqual([entity.id for entity in entities], [node.pk for node in nodes] + [self.computer.pk])
+        self.assertTrue(all(entity.user.id == nodes[0].user.pk for entity in entities[:3]))
+
+    def test_cursor_nested(self):
+        """Test that nested `cursor` contexts get their own cursor and do not discard each other's result set."""
+        with self.backend.cursor() as outer:
+            outer.execute('SELECT * FROM generate_series(1, 3)')
+            self.assertEqual(outer.fetchone(), (1,))
+
+            with self.backend.cursor() as inner:
+                self.assertIsNot(inner, outer)
+                inner.execute('SELECT 42')
+                self.assertEqual(inner.fetchall(), [(42,)])
+
+            self.assertEqual(outer.fetchall(), [(2,), (3,)])
+
+    def test_execute_raw_prepare(self):
+        """Test that a raw statement executed through a prepared statement can be executed repeatedly."""
+        query = 'SELECT COUNT(*) FROM db_dbuser WHERE id < 0'
+        for _ in range(2):
+            self.assertEqual(list(self.backend.execute_raw(query, prepare=True)), [(0,)])
+
+    def test_execute_raw_iter(self):
+        """Test that `execute_raw_iter` yields the rows of the result set in chunks."""
+        query = 'SELECT * FROM generate_series(1, 5)'
+        chunks = list(self.backend.execute_raw_iter(query, chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(list(self.backend.execute_raw(query, stream=True, arraysize=2)), [(i,) for i in range(1, 6)])
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'skip_if_not_django')
+def test_iter_query_django(backend):
+    """Test that `DjangoBackend.iter_query` yields the backend entities of all models returned by the query."""
+    from aiida.backends.djsite.db.models import DbNode
+    pks = {orm.Data().store().pk for _ in range(3)}
+    entities = list(backend.iter_query(DbNode.objects.filter(id__in=pks), chunk_size=2))
+    assert {entity.pk for entity in entities} == pks
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'skip_if_not_sqlalchemy')
+def test_iter_query_sqlalchemy(backend):
+    """Test that `SqlaBackend.iter_query` yields the backend entities of all models returned by the query."""
+    from aiida.backends.sqlalchemy.models.node import DbNode
+    pks = {orm.Data().store().pk for _ in range(3)}
+    entities = list(backend.iter_query(DbNode.query.filter(DbNode.id.in_(pks)), chunk_size=2))
+    assert {entity.pk for entity in entities} == pks
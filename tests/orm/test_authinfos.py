@@ -31,6 +31,58 @@ class TestAuthinfo(AiidaTestCase):
         self.auth_info.set_auth_params(auth_params)
         self.assertEqual(self.auth_info.get_auth_params(), auth_params)
 
+    def test_set_fields(self):
+        """Test setting multiple fields at once."""
+        auth_params = {'safe_interval': 100}
+        metadata = {'workdir': '/tmp/workdir'}
+
+        self.auth_info.set_fields(enabled=False, auth_params=auth_params, metadata=metadata)
+
+        auth_info = authinfos.AuthInfo.objects.get(id=self.auth_info.pk)
+        self.assertFalse(auth_info.enabled)
+        self.assertEqual(auth_info.get_auth_params(), auth_params)
+        self.assertEqual(auth_info.get_metadata(), metadata)
+
+    def test_metadata_key(self):
+        """Test getting and setting a single key of the metadata."""
+        backend_entity = self.auth_info.backend_entity
+        backend_entity.set_metadata_key('workdir', '/tmp/workdir')
+        backend_entity.set_metadata_key('other', 1)
+
+        self.assertEqual(backend_entity.get_metadata_key('workdir'), '/tmp/workdir')
+        self.assertEqual(self.auth_info.get_metadata(), {'workdir': '/tmp/workdir', 'other': 1})
+        self.assertEqual(self.auth_info.get_workdir(), '/tmp/workdir')
+
+        with self.assertRaises(KeyError):
+            backend_entity.get_metadata_key('non_existent')
+
+    def test_computer_user(self):
+        """Test that the computer and user of a loaded AuthInfo are correct and only converted once."""
+        auth_info = authinfos.AuthInfo.objects.get(id=self.auth_info.pk)
+        self.assertEqual(auth_info.computer.pk, self.computer.pk)  # pylint: disable=no-member
+        self.assertEqual(auth_info.user.pk, self.auth_info.user.pk)
+        self.assertIs(auth_info.backend_entity.computer, auth_info.backend_entity.computer)
+        self.assertIs(auth_info.backend_entity.user, auth_info.backend_entity.user)
+
+    def test_get_computer_user(self):
+        """Test that an AuthInfo retrieved for a computer and user pair reuses the given computer and user."""
+        computer = self.computer.backend_entity  # pylint: disable=no-member
+        user = self.auth_info.user.backend_entity
+        backend_entity = self.backend.authinfos.get(computer, user)
+        self.assertEqual(backend_entity.id, self.auth_info.pk)
+        self.assertIs(backend_entity.computer, computer)
+        self.assertIs(backend_entity.user, user)
+
+    def test_get_many(self):
+        """Test retrieving the AuthInfos of multiple computer and user pairs at once."""
+        pair = (self.computer.pk, self.auth_info.user.pk)  # pylint: disable=no-member
+        missing = (self.computer.pk, -1)  # pylint: disable=no-member
+
+        result = authinfos.AuthInfo.objects.get_many([pair, missing])
+        self.assertEqual(list(result.keys()), [pair])
+        self.assertEqual(result[pair].pk, self.auth_info.pk)
+        self.assertEqual(authinfos.AuthInfo.objects.get_many([]), {})
+
     def test_delete(self):
         """Test deleting a single AuthInfo."""
         pk = self.auth_info.pk
@@ -650,7 +650,7 @@ class TestBasic:
 
     @staticmethod
     def test_flat():
-        """Test the `flat` keyword for the `QueryBuilder.all()` method."""
+        """Test the `flat` keyword for the `QueryBuilder.all()` and `QueryBuilder.iterall()` methods."""
         pks = []
         uuids = []
         for _ in range(10):
@@ -671,6 +671,7 @@ class TestBasic:
         assert isinstance(result, list)
         assert len(result) == 20
         assert result == list(chain.from_iterable(zip(pks, uuids)))
+        assert list(builder.iterall(batch_size=3, flat=True)) == result
 
 
 @pytest.mark.usefixtures('clear_database_before_test')
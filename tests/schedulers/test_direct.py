@@ -7,9 +7,11 @@
 # For further information on the license, see the LICENSE.txt file        #
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
-# pylint: disable=invalid-name,protected-access
+# pylint: disable=invalid-name,protected-access,redefined-outer-name
 """Tests for the `DirectScheduler` plugin."""
-import unittest
+import logging
+
+import pytest
 
 from aiida.schedulers.plugins.direct import DirectScheduler
 from aiida.schedulers import SchedulerError
@@ -48,44 +50,34 @@ linux_ps_output_str = """11354 Ss   aiida    00:00:00
 wrong_output = """aaa"""
 
 
-class TestParserGetJobList(unittest.TestCase):
-    """
-    Tests to verify if teh function _parse_joblist_output behave correctly
-    The tests is done parsing a string defined above, to be used offline
-    """
+@pytest.fixture(scope='module')
+def scheduler():
+    """Return a `DirectScheduler` instance that is shared by the tests of this module."""
+    return DirectScheduler()
 
-    def test_parse_mac_wrong(self):
-        """
-        Test whether _parse_joblist can parse the qstat -f output
-        """
-        scheduler = DirectScheduler()
 
-        with self.assertRaises(SchedulerError):
-            scheduler._parse_joblist_output(retval=0, stdout=wrong_output, stderr='')
+def test_parse_joblist_output_wrong(scheduler):
+    """Test that `_parse_joblist_output` raises for output that is not produced by `ps`."""
+    with pytest.raises(SchedulerError):
+        scheduler._parse_joblist_output(retval=0, stdout=wrong_output, stderr='')
 
-    def test_parse_mac_joblist_output(self):
-        """
-        Test whether _parse_joblist can parse the qstat -f output
-        """
-        s = DirectScheduler()
 
-        result = s._parse_joblist_output(retval=0, stdout=mac_ps_output_str, stderr='')
-        self.assertEqual(len(result), 24)
+def test_parse_mac_joblist_output(scheduler):
+    """Test whether `_parse_joblist_output` can parse the `ps` output on MacOS."""
+    result = scheduler._parse_joblist_output(retval=0, stdout=mac_ps_output_str, stderr='')
+    assert len(result) == 24
 
-        job_ids = [job.job_id for job in result]
-        self.assertIn('87849', job_ids)
+    job_ids = [job.job_id for job in result]
+    assert '87849' in job_ids
 
-    def test_parse_linux_joblist_output(self):
-        """
-        Test whether _parse_joblist can parse the qstat -f output
-        """
-        scheduler = DirectScheduler()
 
-        result = scheduler._parse_joblist_output(retval=0, stdout=linux_ps_output_str, stderr='')
-        self.assertEqual(len(result), 3)
+def test_parse_linux_joblist_output(scheduler):
+    """Test whether `_parse_joblist_output` can parse the `ps` output on Linux."""
+    result = scheduler._parse_joblist_output(retval=0, stdout=linux_ps_output_str, stderr='')
+    assert len(result) == 3
 
-        job_ids = [job.job_id for job in result]
-        self.assertIn('11383', job_ids)
+    job_ids = [job.job_id for job in result]
+    assert '11383' in job_ids
 
 
 def test_submit_script_rerunnable(aiida_caplog):
@@ -98,5 +90,5 @@ def test_submit_script_rerunnable(aiida_caplog):
     job_tmpl.rerunnable = True
     direct._get_submit_script_header(job_tmpl)
 
-    assert 'rerunnable' in aiida_caplog.text
-    assert 'has no effect' in aiida_caplog.text
+    warnings = [record.getMessage() for record in aiida_caplog.records if record.levelno == logging.WARNING]
+    assert any('rerunnable' in message and 'has no effect' in message for message in warnings)
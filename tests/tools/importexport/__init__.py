@@ -36,3 +36,11 @@ class AiidaArchiveTestCase(AiidaTestCase):
         # don't want output
         EXPORT_LOGGER.setLevel('INFO')
         IMPORT_LOGGER.setLevel('INFO')
+
+    def count_nodes(self):
+        """Return the number of nodes in the database.
+
+        The count is queried with a prepared raw SQL statement, which avoids building a `QueryBuilder` for each count.
+        """
+        [(count,)] = self.backend.execute_raw('SELECT count(*) FROM db_dbnode', prepare=True)
+        return count
@@ -21,6 +21,25 @@ from . import AiidaArchiveTestCase
 class TestSpecificImport(AiidaArchiveTestCase):
     """Test specific ex-/import cases"""
 
+    def export_and_import(self, nodes):
+        """Export the given nodes, clean the database and import the resulting archive again.
+
+        The archive is only read back once within the test, so it is written without compression.
+        """
+        with tempfile.NamedTemporaryFile() as handle:
+            export(nodes, filename=handle.name, overwrite=True, writer_init={'use_compression': False})
+
+            # Check that we have the expected number of nodes in the database
+            self.assertEqual(self.count_nodes(), len(nodes))
+
+            # Clean the database and verify there are no nodes left
+            self.refurbish_db()
+            self.assertEqual(self.count_nodes(), 0)
+
+            # After importing we should have the original number of nodes again
+            import_data(handle.name)
+            self.assertEqual(self.count_nodes(), len(nodes))
+
     def test_simple_import(self):
         """
         This is a very simple test which checks that an archive file with nodes
@@ -48,20 +67,7 @@ class TestSpecificImport(AiidaArchiveTestCase):
             }
         ).store()
 
-        with tempfile.NamedTemporaryFile() as handle:
-            nodes = [parameters]
-            export(nodes, filename=handle.name, overwrite=True)
-
-            # Check that we have the expected number of nodes in the database
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
-
-            # Clean the database and verify there are no nodes left
-            self.refurbish_db()
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), 0)
-
-            # After importing we should have the original number of nodes again
-            import_data(handle.name)
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
+        self.export_and_import([parameters])
 
     def test_cycle_structure_data(self):
         """
@@ -85,10 +91,12 @@ class TestSpecificImport(AiidaArchiveTestCase):
             'mass': 32.065,
             'name': 'S'
         }]
+        test_sites = [{'kind_name': 'Fe', 'position': [0., 0., 0.]}, {'kind_name': 'S', 'position': [2., 2., 2.]}]
 
+        # The kinds and sites are set directly in their raw format instead of through `append_atom`, which has to check
+        # each new atom against the existing kinds
         structure = orm.StructureData(cell=test_cell)
-        structure.append_atom(symbols=['Fe'], position=[0, 0, 0])
-        structure.append_atom(symbols=['S'], position=[2, 2, 2])
+        structure.set_attribute_many({'kinds': test_kinds, 'sites': test_sites})
         structure.label = test_label
         structure.store()
 
@@ -107,53 +115,39 @@ class TestSpecificImport(AiidaArchiveTestCase):
         parent_process.seal()
         child_calculation.seal()
 
-        with tempfile.NamedTemporaryFile() as handle:
-
-            nodes = [structure, child_calculation, parent_process, remote_folder]
-            export(nodes, filename=handle.name, overwrite=True)
-
-            # Check that we have the expected number of nodes in the database
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
-
-            # Clean the database and verify there are no nodes left
-            self.refurbish_db()
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), 0)
-
-            # After importing we should have the original number of nodes again
-            import_data(handle.name)
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
-
-            # Verify that orm.CalculationNodes have non-empty attribute dictionaries
-            builder = orm.QueryBuilder().append(orm.CalculationNode)
-            for [calculation] in builder.iterall():
-                self.assertIsInstance(calculation.attributes, dict)
-                self.assertNotEqual(len(calculation.attributes), 0)
-
-            # Verify that the structure data maintained its label, cell and kinds
-            builder = orm.QueryBuilder().append(orm.StructureData)
-            for [structure] in builder.iterall():
-                self.assertEqual(structure.label, test_label)
-                # Check that they are almost the same, within numerical precision
-                self.assertTrue(np.abs(np.array(structure.cell) - np.array(test_cell)).max() < 1.e-12)
-
-            builder = orm.QueryBuilder().append(orm.StructureData, project=['attributes.kinds'])
-            for [kinds] in builder.iterall():
-                self.assertEqual(len(kinds), 2)
-                for kind in kinds:
-                    self.assertIn(kind, test_kinds)
-
-            # Check that there is a StructureData that is an output of a orm.CalculationNode
-            builder = orm.QueryBuilder()
-            builder.append(orm.CalculationNode, project=['uuid'], tag='calculation')
-            builder.append(orm.StructureData, with_incoming='calculation')
-            self.assertGreater(len(builder.all()), 0)
-
-            # Check that there is a RemoteData that is a child and parent of a orm.CalculationNode
-            builder = orm.QueryBuilder()
-            builder.append(orm.CalculationNode, tag='parent')
-            builder.append(orm.RemoteData, project=['uuid'], with_incoming='parent', tag='remote')
-            builder.append(orm.CalculationNode, with_incoming='remote')
-            self.assertGreater(len(builder.all()), 0)
+        self.export_and_import([structure, child_calculation, parent_process, remote_folder])
+
+        # Verify that orm.CalculationNodes have non-empty attribute dictionaries
+        builder = orm.QueryBuilder().append(orm.CalculationNode)
+        for [calculation] in builder.iterall():
+            self.assertIsInstance(calculation.attributes, dict)
+            self.assertNotEqual(len(calculation.attributes), 0)
+
+        # Verify that the structure data maintained its label, cell and kinds
+        builder = orm.QueryBuilder().append(orm.StructureData)
+        for [structure] in builder.iterall():
+            self.assertEqual(structure.label, test_label)
+            # Check that they are almost the same, within numerical precision
+            self.assertTrue(np.abs(np.array(structure.cell) - np.array(test_cell)).max() < 1.e-12)
+
+        builder = orm.QueryBuilder().append(orm.StructureData, project=['attributes.kinds'])
+        for [kinds] in builder.iterall():
+            self.assertEqual(len(kinds), 2)
+            for kind in kinds:
+                self.assertIn(kind, test_kinds)
+
+        # Check that there is a StructureData that is an output of a orm.CalculationNode
+        builder = orm.QueryBuilder()
+        builder.append(orm.CalculationNode, project=['uuid'], tag='calculation')
+        builder.append(orm.StructureData, with_incoming='calculation')
+        self.assertGreater(len(builder.all()), 0)
+
+        # Check that there is a RemoteData that is a child and parent of a orm.CalculationNode
+        builder = orm.QueryBuilder()
+        builder.append(orm.CalculationNode, tag='parent')
+        builder.append(orm.RemoteData, project=['uuid'], with_incoming='parent', tag='remote')
+        builder.append(orm.CalculationNode, with_incoming='remote')
+        self.assertGreater(len(builder.all()), 0)
 
     def test_import_checkpoints(self):
         """Check that process node checkpoints are stripped when importing.
@@ -168,19 +162,7 @@ class TestSpecificImport(AiidaArchiveTestCase):
         node_uuid = node.uuid
         assert node.checkpoint == 12
 
-        with tempfile.NamedTemporaryFile() as handle:
-            nodes = [node]
-            export(nodes, filename=handle.name, overwrite=True)
-
-            # Check that we have the expected number of nodes in the database
-            self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
-
-            # Clean the database and verify there are no nodes left
-            self.clean_db()
-            assert orm.QueryBuilder().append(orm.Node).count() == 0
-
-            import_data(handle.name)
+        self.export_and_import([node])
 
-        assert orm.QueryBuilder().append(orm.Node).count() == len(nodes)
         node_new = orm.load_node(node_uuid)
         assert node_new.checkpoint is None